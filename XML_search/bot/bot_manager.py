@@ -39,6 +39,11 @@ from XML_search.bot.handlers.error_handler import ErrorHandler
 from XML_search.bot.handlers.coord_export_handler import CoordExportHandler
 from XML_search.bot.keyboards.main_keyboard import MainKeyboard
 
+# Фильтры сообщений диалога строятся один раз при импорте модуля
+_BACK_FILTER = filters.Text(MainKeyboard.BACK_BUTTONS)
+_INLINE_RESULT_FILTER = filters.Regex(r'^🔷 SRID:')
+_MENU_BUTTON_FILTER = filters.Regex(f"^{re.escape(MainKeyboard.BUTTON_MENU)}$")
+
 
 class BotManager:
     """Менеджер бота с интеграцией всех компонентов"""
@@ -292,15 +297,15 @@ class BotManager:
                 ],
                 States.SEARCH_INPUT: [
                     # Сначала обрабатываем кнопку возврата в меню
-                    MessageHandler(filters.Text([MainKeyboard.BUTTON_MENU]), self.menu_handler.show_main_menu_and_return_state),
+                    MessageHandler(_BACK_FILTER, self.menu_handler.show_main_menu_and_return_state),
                     # Затем обрабатываем inline результаты (игнорируем их)
-                    MessageHandler(filters.Regex(r'^🔷 SRID:'), self.search_handler.handle_inline_result_message),
+                    MessageHandler(_INLINE_RESULT_FILTER, self.search_handler.handle_inline_result_message),
                     # Остальные текстовые сообщения обрабатываем как поисковые запросы
                     MessageHandler(filters.TEXT & ~filters.COMMAND, self.search_handler.handle_filter_input),
                 ],
             },
             fallbacks=[
-                MessageHandler(filters.Regex(f"^{re.escape(MainKeyboard.BUTTON_MENU)}$"), self.menu_handler.show_main_menu_and_return_state),
+                MessageHandler(_MENU_BUTTON_FILTER, self.menu_handler.show_main_menu_and_return_state),
                 CommandHandler("cancel", self.menu_handler.cancel),
                 CommandHandler("help", self.menu_handler.help),
                 MessageHandler(filters.TEXT, self.menu_handler.handle_unknown_command),
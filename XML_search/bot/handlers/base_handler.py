@@ -168,7 +168,7 @@ class BaseHandler(ABC):
         if not context.user_data:
             context.user_data.update({
                 'state': None,
-                'search_results': [],
+                'page_cursor': None,
                 'selected_srid': None,
                 'export_format': None,
                 'authenticated': False,
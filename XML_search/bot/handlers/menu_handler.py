@@ -2,31 +2,60 @@
 Обработчик главного меню бота
 """
 
-from typing import Optional, Any
+from typing import Optional, Any, TYPE_CHECKING
 from telegram import Update, ReplyKeyboardMarkup, KeyboardButton, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes, CommandHandler, ConversationHandler, CallbackQueryHandler, MessageHandler, filters
-from XML_search.enhanced.db_manager import DatabaseManager
-from XML_search.enhanced.metrics_manager import MetricsManager
-from XML_search.enhanced.log_manager import LogManager
-from XML_search.enhanced.cache_manager import CacheManager
-from XML_search.enhanced.export.export_manager import ExportManager
 from ..states import States
 from .base_handler import BaseHandler
 from .auth_handler import AuthHandler
 from XML_search.bot.config import BotConfig
+from XML_search.bot.keyboards.main_keyboard import MainKeyboard
 import logging
 
+if TYPE_CHECKING:
+    # Тяжелые менеджеры нужны только для аннотаций, импортируются лениво
+    from XML_search.enhanced.db_manager import DatabaseManager
+    from XML_search.enhanced.metrics_manager import MetricsManager
+    from XML_search.enhanced.log_manager import LogManager
+    from XML_search.enhanced.cache_manager import CacheManager
+    from XML_search.enhanced.export.export_manager import ExportManager
+
+# Статические тексты сообщений меню
+_HELP_TEXT = (
+    "📋 Доступные команды:\n\n"
+    "/start - Начать работу с ботом\n"
+    "/menu - Показать главное меню\n"
+    "/help - Показать это сообщение\n"
+    "/search - Начать поиск\n"
+    "/export - Экспортировать результаты\n"
+    "/cancel - Отменить текущую операцию\n"
+    "/logout - Выйти из системы"
+)
+_CANCEL_TEXT = (
+    "🔄 Текущая операция отменена.\n"
+    "Используйте /menu для возврата в главное меню."
+)
+_MENU_PROMPT_TEXT = "🔍 Выберите тип поиска:"
+_WELCOME_TEXT = "Добро пожаловать! Я бот для поиска и экспорта систем координат."
+_MENU_WELCOME_TEXT = f"{_MENU_PROMPT_TEXT}\n\n{_WELCOME_TEXT}"
+_UNKNOWN_TEXT = "🤷‍♂️ Неизвестная команда. Пожалуйста, используйте кнопки меню или доступные команды."
+
 class MenuHandler(BaseHandler):
     """Обработчик главного меню"""
     
+    # Константы для кнопок меню
+    BUTTON_COORD_SEARCH = 'Поиск СК по Lat/Lon'
+    BUTTON_DESC_SEARCH = 'Поиск СК по описанию'
+    BUTTON_MENU = '🔙 Главное меню'
+    
     def __init__(self, 
                  config: BotConfig,
-                 db_manager: Optional[DatabaseManager] = None,
-                 metrics: Optional[MetricsManager] = None,
+                 db_manager: Optional["DatabaseManager"] = None,
+                 metrics: Optional["MetricsManager"] = None,
                  auth_handler: Optional[AuthHandler] = None,
-                 logger: Optional[LogManager] = None,
-                 cache: Optional[CacheManager] = None,
-                 export_manager: Optional[ExportManager] = None):
+                 logger: Optional["LogManager"] = None,
+                 cache: Optional["CacheManager"] = None,
+                 export_manager: Optional["ExportManager"] = None):
         """
         Инициализация обработчика меню
         
@@ -41,17 +70,18 @@ class MenuHandler(BaseHandler):
         """
         super().__init__(config)
         self._db_manager = db_manager
-        self.metrics = metrics or MetricsManager()
+        if metrics is None:
+            from XML_search.enhanced.metrics_manager import MetricsManager
+            metrics = MetricsManager()
+        self.metrics = metrics
         self.auth_handler = auth_handler
         self.logger = logger or logging.getLogger(self.__class__.__module__)
-        self.cache = cache or CacheManager(ttl=config.CACHE_TTL, max_size=config.CACHE_MAX_SIZE)
+        if cache is None:
+            from XML_search.enhanced.cache_manager import CacheManager
+            cache = CacheManager(ttl=config.CACHE_TTL, max_size=config.CACHE_MAX_SIZE)
+        self.cache = cache
         self.export_manager = export_manager
         
-        # Константы для кнопок меню
-        self.BUTTON_COORD_SEARCH = 'Поиск СК по Lat/Lon'
-        self.BUTTON_DESC_SEARCH = 'Поиск СК по описанию'
-        self.BUTTON_MENU = '🔙 Главное меню'
-        
     async def _handle_update(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> States:
         """
         Обработка команды /start и отображение главного меню
@@ -89,21 +119,16 @@ class MenuHandler(BaseHandler):
         self.logger.info(f"[MenuHandler.show_main_menu] user_id={user_id} — показ главного меню")
         await self.log_access(user_id, 'show_main_menu')
         
-        # Создаем клавиатуру главного меню
-        keyboard = [
-            [KeyboardButton(self.BUTTON_COORD_SEARCH)],
-            [KeyboardButton(self.BUTTON_DESC_SEARCH)]
-        ]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-        
-        await update.message.reply_text(
-            "🔍 Выберите тип поиска:",
-            reply_markup=reply_markup
-        )
+        # Приветствие отправляется вместе с меню и только при первом показе
+        if context.user_data.get('greeted', False):
+            text = _MENU_PROMPT_TEXT
+        else:
+            text = _MENU_WELCOME_TEXT
+            context.user_data['greeted'] = True
         
-        # Приветственное сообщение
         await update.message.reply_text(
-            "Добро пожаловать! Я бот для поиска и экспорта систем координат."
+            text,
+            reply_markup=MainKeyboard.get_cached_keyboard()
         )
         
     async def handle_menu_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> States:
@@ -199,18 +224,7 @@ class MenuHandler(BaseHandler):
             States: Следующее состояние диалога
         """
         try:
-            help_text = (
-                "📋 Доступные команды:\n\n"
-                "/start - Начать работу с ботом\n"
-                "/menu - Показать главное меню\n"
-                "/help - Показать это сообщение\n"
-                "/search - Начать поиск\n"
-                "/export - Экспортировать результаты\n"
-                "/cancel - Отменить текущую операцию\n"
-                "/logout - Выйти из системы"
-            )
-        
-            await update.message.reply_text(help_text)
+            await update.message.reply_text(_HELP_TEXT)
             return States.MAIN_MENU
             
         except Exception as e:
@@ -233,10 +247,7 @@ class MenuHandler(BaseHandler):
             # Очищаем состояние пользователя
             await self.clear_user_state(context)
             
-            await update.message.reply_text(
-                "🔄 Текущая операция отменена.\n"
-                "Используйте /menu для возврата в главное меню."
-            )
+            await update.message.reply_text(_CANCEL_TEXT)
             return States.MAIN_MENU
             
         except Exception as e:
@@ -250,9 +261,7 @@ class MenuHandler(BaseHandler):
         """
         user_id = update.effective_user.id if update.effective_user else "unknown"
         self.logger.info(f"[MenuHandler.handle_unknown_command] user_id={user_id}, text={update.message.text}")
-        await update.message.reply_text(
-            "🤷‍♂️ Неизвестная команда. Пожалуйста, используйте кнопки меню или доступные команды."
-        )
+        await update.message.reply_text(_UNKNOWN_TEXT)
         # Вместо того чтобы просто показывать меню, мы возвращаем состояние,
         # чтобы ConversationHandler мог правильно на него среагировать.
         # Если это вызывается из fallback другого ConversationHandler, то тот должен
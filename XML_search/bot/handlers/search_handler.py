@@ -3,11 +3,17 @@
 """
 
 import os
-from typing import Dict, List, Any, Optional
+import re
+import asyncio
+import time
+import functools
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Dict, List, Any, Optional, Tuple, Callable, Awaitable, AsyncIterator, TYPE_CHECKING
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, InlineQueryResultArticle, InputTextMessageContent
 from telegram.constants import ParseMode
+from telegram.error import NetworkError, RetryAfter
 from telegram.ext import ContextTypes, CallbackContext, CommandHandler, ConversationHandler, MessageHandler, filters, CallbackQueryHandler
-from XML_search.enhanced.db_manager import DatabaseManager
 from XML_search.enhanced.metrics_manager import MetricsManager
 from XML_search.enhanced.log_manager import LogManager
 from XML_search.enhanced.cache_manager import CacheManager
@@ -16,53 +22,246 @@ from XML_search.bot.states import States
 from XML_search.bot.handlers.base_handler import BaseHandler
 from XML_search.bot.config import BotConfig
 from XML_search.enhanced.search.search_engine import EnhancedSearchEngine
-from XML_search.bot.keyboards.inline_keyboard import get_export_keyboard_for_srid
 from XML_search.bot.keyboards.main_keyboard import MainKeyboard
 from XML_search.enhanced.export.exporters.gmv20 import GMv20Exporter
 from XML_search.enhanced.export.exporters.gmv25 import GMv25Exporter
 from XML_search.enhanced.export.exporters.civil3d import Civil3DExporter
 from telegram import InputFile
-import re # Импортируем re для функции экранирования
 import uuid
 import logging
 from XML_search.bot.handlers.coord_export_handler import CoordExportHandler
 
+if TYPE_CHECKING:
+    from XML_search.enhanced.db_manager import DatabaseManager
+
+# Статические тексты сообщений поиска
+_EMPTY_QUERY_TEXT = "⚠️ Пожалуйста, введите текст для поиска."
+_SHORT_QUERY_TEXT = "⚠️ Запрос слишком короткий. Минимум 3 символа."
+_NO_RESULTS_TEXT = (
+    "🔍 По вашему запросу ничего не найдено.\n"
+    "Попробуйте изменить параметры поиска или ввести другой запрос."
+)
+_FSM_CALLBACK_ERROR_TEXT = "Произошла ошибка при обработке вашего запроса."
+_FSM_MESSAGE_ERROR_TEXT = "Произошла ошибка. Попробуйте позже или обратитесь к администратору."
+_SEARCH_RETRY_ERROR_TEXT = "Произошла ошибка при поиске. Попробуйте еще раз."
+
+# Ожидаемые ошибки Telegram API (устаревший callback, таймаут, ограничение частоты):
+# логируются без трассировки. BadRequest и TimedOut - подклассы NetworkError
+_TRANSIENT_TELEGRAM_ERRORS = (NetworkError, RetryAfter)
+
+# Префикс callback_data выбора системы координат
+_SELECT_SRID_PREFIX = "select_srid_"
+_SELECT_SRID_PREFIX_LEN = len(_SELECT_SRID_PREFIX)
+
+# Фильтры сообщений диалога поиска (создаются один раз при импорте):
+# сообщения от выбора inline результата начинаются с "🔷 SRID:"
+_INLINE_RESULT_RE = re.compile(r'^🔷 SRID:')
+_INLINE_RESULT_FILTER = filters.Regex(_INLINE_RESULT_RE)
+_BACK_FILTER = filters.Text(MainKeyboard.BACK_BUTTONS)
+
+# callback_data кнопок экспорта inline-сообщений: inline_export_{тип}_{формат}_{srid}
+_INLINE_EXPORT_RE = re.compile(r'^inline_export_(?P<type>[^_]+)_(?P<fmt>[^_]+)_(?P<srid>\d+)$')
+# Формат из callback_data -> формат CoordExportHandler. Кнопки создаются уже
+# в нижнем регистре; прежнее написание оставлено для ранее отправленных сообщений
+_INLINE_EXPORT_FORMATS = {
+    'civil3d': 'civil3d', 'gmv20': 'gmv20', 'gmv25': 'gmv25',
+    'Civil3D': 'civil3d', 'GMV20': 'gmv20', 'GMV25': 'gmv25',
+}
+
+# Объединенный поиск: custom_geom (src='c') и UTM зоны из spatial_ref_sys (src='u').
+# Параметры: $1 - текст запроса (сравнение с SRID), $2 - шаблон '%запрос%' для ILIKE,
+# $3..$5 - курсор (src, rank, srid), $6 - размер выборки.
+# Пагинация по ключу (src, rank, srid): страница начинается строго после курсора
+# предыдущей, поэтому OFFSET не нужен. Строки custom_geom идут первыми ('c' < 'u').
+_SEARCH_QUERY = """
+    SELECT src, srid, name, deg, info, p, rank
+    FROM (
+        SELECT 'c' AS src, cg.srid, cg.name, cg.deg, cg.info, cg.p,
+            CASE 
+                WHEN CAST(cg.srid AS TEXT) = $1 THEN 1
+                WHEN cg.name ILIKE $2 THEN 2
+                WHEN cg.info ILIKE $2 THEN 3
+                ELSE 4
+            END AS rank
+        FROM public.custom_geom cg
+        WHERE (
+            cg.name ILIKE $2
+            OR cg.info ILIKE $2
+            OR CAST(cg.srid AS TEXT) = $1
+            OR cg.p ILIKE $2
+        )
+        AND cg.srid BETWEEN 100000 AND 101500
+        UNION ALL
+        SELECT 'u' AS src, srs.srid, NULL, NULL, NULL, NULL, 0 AS rank
+        FROM public.spatial_ref_sys srs
+        WHERE srs.srid BETWEEN 32601 AND 32660
+        AND (
+            CAST(srs.srid AS TEXT) = $1
+            OR srs.srtext ILIKE $2
+            OR srs.proj4text ILIKE $2
+        )
+    ) AS combined
+    WHERE (src, rank, srid) > ($3, $4, $5)
+    ORDER BY src, rank, srid
+    LIMIT $6
+"""
+
+# Базовые варианты без номера зоны, дающие слишком широкие результаты
+_PROBLEMATIC_BASES = frozenset({'gsk11', 'гск11', 'msk', 'мск', 'sk42', 'ск42', 'sk95', 'ск95', 'sk63', 'ск63'})
+_PROBLEMATIC_BASES_UPPER = frozenset(base.upper() for base in _PROBLEMATIC_BASES)
+
+# Курсор первой страницы: меньше любого ключа (src, rank, srid)
+_FIRST_PAGE_CURSOR = ('', 0, 0)
+
+# Постоянные поля результата для UTM зон из spatial_ref_sys
+# (srtext/proj4text/description дублируют info для обратной совместимости)
+_UTM_RESULT_TEMPLATE: Dict[str, Any] = {
+    'info': "WGS84",
+    'p': "EPSG",  # UTM системы всегда EPSG
+    'deg': 6,  # Стандартная степень для UTM
+    'auth_name': "EPSG",
+    'srtext': "WGS84",
+    'proj4text': "WGS84",
+    'description': "WGS84",
+}
+
+# Размер кэша клавиатур экспорта для inline-результатов (по SRID)
+_EXPORT_MARKUP_CACHE_SIZE = 1024
+
+# Параметры кэша результатов по тексту запроса
+_SEARCH_CACHE_TTL = 300
+_SEARCH_CACHE_MAX_SIZE = 4096
+
+# Таблица экранирования специальных символов MarkdownV2
+# (список символов согласно документации Telegram Bot API)
+_MDV2 = str.maketrans({c: '\\' + c for c in r'_*[]()~`>#+-=|{}.!'})
+
+# Шаблон текста сообщения для инлайн-результата (значения экранируются через _MDV2)
+_INLINE_TEMPLATE = (
+    "🔷 *SRID:* `{srid}`\n"
+    "📝 *Название:* {name}\n"
+    "ℹ️ *Описание:* {description}\n"
+    "✅ *Достоверность:* {p}"
+)
+
+class _TTLCache:
+    """
+    LRU-кэш с ограниченным временем жизни записей
+    
+    get/set выполняются за O(1): при переполнении вытесняется самая давно
+    использованная запись. Блокировки не нужны - кэш используется только
+    из цикла событий, а операции не содержат точек переключения.
+    """
+    
+    __slots__ = ('_data', '_max_size', '_ttl')
+    
+    def __init__(self, max_size: int, ttl: float):
+        """
+        Args:
+            max_size: Максимальное число записей
+            ttl: Время жизни записи в секундах
+        """
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+        
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Получение значения
+        
+        Args:
+            key: Ключ
+            
+        Returns:
+            Optional[Any]: Значение или None, если записи нет или она устарела
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+        
+    def set(self, key: str, value: Any) -> None:
+        """
+        Сохранение значения
+        
+        Args:
+            key: Ключ
+            value: Значение
+        """
+        data = self._data
+        data[key] = (time.monotonic() + self._ttl, value)
+        data.move_to_end(key)
+        if len(data) > self._max_size:
+            data.popitem(last=False)
+
 # Вспомогательная функция для экранирования специальных символов MarkdownV2
 def escape_markdown_v2(text: str) -> str:
     """Экранирует специальные символы для MarkdownV2."""
-    if not text:
-        return ""
-    # Список символов для экранирования согласно документации Telegram Bot API
-    escape_chars = r'_*[]()~`>#+-=|{}.!'
-    return re.sub(f'([{re.escape(escape_chars)}])', r'\\\1', text)
+    return text.translate(_MDV2) if text else ""
 
 class SearchHandler(BaseHandler):
     """Обработчик поиска систем координат"""
     
+    # Клавиатура выбора формата экспорта (неизменяема, создается один раз)
+    _EXPORT_MARKUP = InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("Civil 3D", callback_data="export_civil3d"),
+            InlineKeyboardButton("GMv20", callback_data="export_gmv20")
+        ],
+        [
+            InlineKeyboardButton("GMv25", callback_data="export_gmv25")
+        ],
+        [
+            InlineKeyboardButton("🔙 В меню", callback_data="back_to_menu")
+        ]
+    ])
+    
+    # Диспетчер статических callback_data -> имя метода-обработчика
+    _CB_STATIC = {
+        "back_to_menu": "_on_back_to_menu",
+        "prev_page": "_on_prev_page",
+        "next_page": "_on_next_page",
+    }
+    
     # ОПРЕДЕЛЯЕМ _log_wrapper КАК МЕТОД КЛАССА
     def _log_wrapper(self, handler_func, name):
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
             user_id = getattr(update.effective_user, 'id', None) if update.effective_user else None
-            self._logger.info(f"[SearchFSM] {name}: user_id={user_id}, state={context.user_data.get('state') if context.user_data else 'N/A'}")
+            # Переходы FSM логируются на уровне DEBUG; аргументы не вычисляются, если уровень выключен
+            debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                self._logger.debug(
+                    "[SearchFSM] %s: user_id=%s, state=%s",
+                    name, user_id, context.user_data.get('state') if context.user_data else 'N/A'
+                )
             try:
                 result = await handler_func(update, context)
-                if isinstance(result, States):
-                    self._logger.info(f"[SearchFSM] {name}: new_state={result}, user_id={user_id}")
+                if debug_enabled and isinstance(result, States):
+                    self._logger.debug("[SearchFSM] %s: new_state=%s, user_id=%s", name, result, user_id)
                 return result
             except Exception as e:
-                self._logger.error(f"[SearchFSM] {name}: ОШИБКА={e}, user_id={user_id}", exc_info=True)
+                if isinstance(e, _TRANSIENT_TELEGRAM_ERRORS):
+                    # Ожидаемые ошибки Telegram API: трассировка не нужна
+                    self._logger.warning("[SearchFSM] %s: ошибка Telegram API=%s, user_id=%s", name, e, user_id)
+                else:
+                    self._logger.error("[SearchFSM] %s: ОШИБКА=%s, user_id=%s", name, e, user_id, exc_info=True)
                 if update.callback_query:
                     try:
-                        await update.callback_query.answer("Произошла ошибка при обработке вашего запроса.", show_alert=True)
+                        await update.callback_query.answer(_FSM_CALLBACK_ERROR_TEXT, show_alert=True)
                     except Exception: pass
                 elif update.message:
                     try:
-                        await update.message.reply_text("Произошла ошибка. Попробуйте позже или обратитесь к администратору.")
+                        await update.message.reply_text(_FSM_MESSAGE_ERROR_TEXT)
                     except Exception: pass
                 return States.MAIN_MENU
         return wrapper
 
-    def __init__(self, config: BotConfig, db_manager=None, metrics=None, logger=None, cache=None, menu_handler=None, enhanced_search_engine: Optional[EnhancedSearchEngine] = None):
+    def __init__(self, config: BotConfig, db_manager: Optional["DatabaseManager"] = None, metrics=None, logger=None, cache=None, menu_handler=None, enhanced_search_engine: Optional[EnhancedSearchEngine] = None):
         """
         Инициализация обработчика
         
@@ -88,6 +287,14 @@ class SearchHandler(BaseHandler):
         self.output_dir = getattr(config, 'OUTPUT_DIR', 'output')
         os.makedirs(self.output_dir, exist_ok=True)
         self.coord_export_handler: Optional[CoordExportHandler] = None # Добавляем атрибут
+        # Ограничение одновременных поисковых запросов к БД, чтобы всплеск
+        # инлайн-запросов не исчерпал пул соединений
+        self._db_semaphore = asyncio.Semaphore(getattr(config, 'DB_MAX_CONNECTIONS', 10))
+        # Кэш результатов поиска для повторяющихся запросов и ожидающие запросы
+        self._search_cache = _TTLCache(_SEARCH_CACHE_MAX_SIZE, _SEARCH_CACHE_TTL)
+        self._inflight_searches: Dict[str, asyncio.Future] = {}
+        # Блокировки экспорта по пользователю: [блокировка, число владельцев и ожидающих]
+        self._user_locks: Dict[int, List[Any]] = {}
         
     async def handle(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """
@@ -156,188 +363,251 @@ class SearchHandler(BaseHandler):
         Returns:
             States: Следующее состояние диалога
         """
-        if update.message and update.message.text and update.message.text.strip().startswith("🔷 SRID:"):
-            self._logger.info(f"[_handle_update] Игнорирование 'эха' от выбора инлайн-результата: {update.message.text[:100]}...")
+        msg = update.message
+        text = msg.text if msg else None
+        query = text.strip() if text else ""
+        log = self._logger
+        metrics = self._metrics
+        
+        if query.startswith("🔷 SRID:"):
+            log.info("[_handle_update] Игнорирование 'эха' от выбора инлайн-результата: %s...", text[:100])
             current_fsm_state = await self.get_user_state(context)
             # Если состояние не найдено или некорректно, можно вернуть состояние по умолчанию для поиска.
             return current_fsm_state if current_fsm_state in [States.SEARCH_INPUT, States.SEARCH_RESULTS] else States.SEARCH_INPUT
-
-        query_type = context.user_data.get("query_type", "description")
-        current_filters = context.user_data.get("search_filters", {})
         
         try:
-            if not update.message or not update.message.text:
-                await update.message.reply_text(
-                    "⚠️ Пожалуйста, введите текст для поиска."
-                )
+            if not text:
+                if msg:
+                    await msg.reply_text(_EMPTY_QUERY_TEXT)
                 return States.SEARCH_INPUT
                 
-            query = update.message.text.strip()
-            
             # Проверяем минимальную длину запроса
             if len(query) < 3:
-                await update.message.reply_text(
-                    "⚠️ Запрос слишком короткий. Минимум 3 символа."
-                )
+                await msg.reply_text(_SHORT_QUERY_TEXT)
                 return States.SEARCH_INPUT
                 
             # Выполняем поиск
-            results = await self._perform_search(query, {})
-            
-            # Сохраняем результаты в контексте
-            await self._update_user_data(
-                context,
-                {
-                    'search_results': results,
-                    'current_page': 0,
-                    'query': query
-                }
-            )
+            results, has_next = await self._perform_search(query, {})
             
-            # Отображаем результаты
-            await self._show_search_results(update, context, results)
+            # В контексте храним только курсоры страниц и SRID текущей страницы
+            context.user_data.pop('search_results', None)
+            page = await self._store_page(context, query, [_FIRST_PAGE_CURSOR], results, has_next)
             
-            # Логируем успешный поиск
-            await self.log_access(
-                update.effective_user.id,
-                'search_completed',
-                {'results_count': len(results)}
+            if metrics:
+                metrics.increment('search_success')
+            
+            # Отображаем результаты и логируем успешный поиск параллельно.
+            # Сбой записи лога доступа не должен превращать уже отправленные
+            # результаты в ошибку поиска, поэтому исключения собираются
+            shown, logged = await asyncio.gather(
+                self._show_search_results(update, context, results, page),
+                self.log_access(
+                    update.effective_user.id,
+                    'search_completed',
+                    {'results_count': len(results)}
+                ),
+                return_exceptions=True
             )
-            if self._metrics:
-                start_time = self._metrics.start_operation('search_success')
-                await self._metrics.record_operation('search_success', start_time)
+            if isinstance(logged, BaseException):
+                log.warning(f"Не удалось записать лог доступа для поиска: {logged}")
+            if isinstance(shown, BaseException):
+                raise shown
             
             return States.SEARCH_RESULTS
             
         except Exception as e:
-            self._logger.error(f"Ошибка при обработке поиска: {e}")
-            if hasattr(self, '_metrics') and self._metrics:
-                await self._metrics.record_error('search_error', str(e))
-            await update.message.reply_text(
-                f"❌ Произошла ошибка при поиске систем координат: {e}\nПожалуйста, обратитесь к администратору."
-            )
+            log.error(f"Ошибка при обработке поиска: {e}")
+            if metrics:
+                await metrics.record_error('search_error', str(e))
+            if msg:
+                await msg.reply_text(
+                    f"❌ Произошла ошибка при поиске систем координат: {e}\nПожалуйста, обратитесь к администратору."
+                )
             return States.SEARCH_ERROR
             
-    async def _perform_search(self, query: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    @asynccontextmanager
+    async def _user_lock(self, user_id: int) -> AsyncIterator[None]:
         """
-        Выполнение поиска в базе данных
+        Блокировка, сериализующая операции одного пользователя
+        
+        Запись удаляется, когда блокировку больше никто не держит и не ждет,
+        поэтому словарь не растет с числом пользователей и не требует периодической очистки.
+        
+        Args:
+            user_id: ID пользователя
+        """
+        entry = self._user_locks.get(user_id)
+        if entry is None:
+            entry = self._user_locks[user_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._user_locks[user_id]
+        
+    async def _cached_search(self, key: str, search_func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Получение результатов поиска через TTL-кэш с объединением одинаковых запросов
+        
+        Если такой же запрос уже выполняется, ожидается его результат вместо
+        повторного обращения к БД.
+        
+        Args:
+            key: Ключ кэша
+            search_func: Функция, выполняющая поиск при промахе кэша
+            
+        Returns:
+            Any: Результат search_func (из кэша или нового выполнения)
+        """
+        while True:
+            cached = self._search_cache.get(key)
+            if cached is not None:
+                return cached
+                
+            pending = self._inflight_searches.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Отменен сам ожидающий - пробрасываем; отменен владелец
+                # запроса - повторяем попытку (в том числе выполнить поиск самим)
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_searches[key] = future
+        try:
+            results = await search_func()
+        except Exception as e:
+            future.set_exception(e)
+            # Помечаем исключение как полученное, если ожидающих нет
+            future.exception()
+            raise
+        else:
+            self._search_cache.set(key, results)
+            future.set_result(results)
+            return results
+        finally:
+            # Отмена владельца (CancelledError) не попадает в except Exception:
+            # отменяем будущее, чтобы ожидающие не зависли навсегда
+            if not future.done():
+                future.cancel()
+            if self._inflight_searches.get(key) is future:
+                del self._inflight_searches[key]
+            
+    async def _perform_search(self, query: str, filters: Dict[str, Any],
+                              cursor: Tuple[str, int, int] = _FIRST_PAGE_CURSOR) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Выполнение поиска одной страницы с использованием кэша результатов
         
         Args:
             query: Поисковый запрос
             filters: Фильтры поиска
+            cursor: Ключ (src, rank, srid), после которого начинается страница
             
         Returns:
-            List[Dict[str, Any]]: Результаты поиска
+            Tuple[List[Dict[str, Any]], bool]: Результаты страницы (не более
+            items_per_page) и признак наличия следующей страницы
+        """
+        if filters:
+            # Поиск с фильтрами выполняется без кэша
+            return await self._fetch_search_results(query, cursor)
+        # ILIKE нечувствителен к регистру, поэтому ключ нормализуется
+        return await self._cached_search(
+            f"perform:{query.lower()}:{cursor}",
+            lambda: self._fetch_search_results(query, cursor)
+        )
+        
+    async def _fetch_search_results(self, query: str, cursor: Tuple[str, int, int]) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Выполнение поиска в базе данных
+        
+        Args:
+            query: Поисковый запрос
+            cursor: Ключ (src, rank, srid), после которого начинается страница
+            
+        Returns:
+            Tuple[List[Dict[str, Any]], bool]: Результаты страницы и признак
+            наличия следующей страницы
         """
         try:
             if not self._db_manager:
                 self._logger.error("Менеджер базы данных не инициализирован в SearchHandler!")
                 raise RuntimeError("Менеджер базы данных не инициализирован. Обратитесь к администратору.")
             
-            # Поиск в custom_geom (основные системы координат)
-            search_query_custom = """
-                SELECT cg.srid, cg.name, cg.deg, cg.info, cg.p
-                FROM public.custom_geom cg
-                WHERE (
-                    cg.name ILIKE $1
-                    OR cg.info ILIKE $2
-                    OR CAST(cg.srid AS TEXT) = $3
-                    OR cg.p ILIKE $4
-                )
-                AND cg.srid BETWEEN 100000 AND 101500
-                ORDER BY 
-                    CASE 
-                        WHEN CAST(cg.srid AS TEXT) = $5 THEN 1
-                        WHEN cg.name ILIKE $6 THEN 2
-                        WHEN cg.info ILIKE $7 THEN 3
-                        ELSE 4
-                    END,
-                    cg.srid
-                LIMIT 50
-            """
+            # Поиск в custom_geom (основные системы координат) и UTM систем
+            # в spatial_ref_sys (только зоны северного полушария 32601-32660)
+            # выполняется одним запросом; источник строки определяется по src
             params = (
-                f"%{query}%", f"%{query}%", query, f"%{query}%",  # Основные поиски
-                query, f"%{query}%", f"%{query}%"  # Для сортировки
+                query, f"%{query}%",  # $1 - точный SRID, $2 - шаблон ILIKE
+                *cursor, self.items_per_page + 1  # Курсор и размер страницы
             )
             
-            results_custom = await self._db_manager.fetch(search_query_custom, *params)
-            
-            # Поиск UTM систем в spatial_ref_sys (только зоны северного полушария 32601-32660)
-            search_query_utm = """
-                SELECT srs.srid, srs.auth_name, srs.auth_srid, srs.srtext, srs.proj4text
-                FROM public.spatial_ref_sys srs
-                WHERE srs.srid BETWEEN 32601 AND 32660
-                AND (
-                    CAST(srs.srid AS TEXT) = $1
-                    OR srs.srtext ILIKE $2
-                    OR srs.proj4text ILIKE $3
-                )
-                ORDER BY srs.srid
-                LIMIT 10
-            """
-            utm_params = (query, f"%{query}%", f"%{query}%")
+            # Условия по custom_geom обслуживаются индексами из
+            # setup/migrations/001_custom_geom_trgm.sql (триграммные GIN для
+            # ILIKE и индекс по CAST(srid AS TEXT)); fetch дает повторы
+            # при сбоях соединения, метрики и QueryError
+            async with self._db_semaphore:
+                rows = await self._db_manager.fetch(_SEARCH_QUERY, *params)
             
-            results_utm = await self._db_manager.fetch(search_query_utm, *utm_params)
-            
-            # Объединяем результаты
+            # Объединяем результаты. Форматируются только строки текущей страницы:
+            # лишняя строка выборки нужна лишь как признак следующей страницы
             formatted_results = []
             
-            # Обрабатываем результаты из custom_geom
-            for row in results_custom:
-                # Определяем значение достоверности как в координатном поиске
-                if str(row['srid']).startswith('326'):
-                    p_value = "EPSG"
+            for row in rows[:self.items_per_page]:
+                # Распаковка в порядке столбцов SELECT вместо поиска по имени ключа
+                src, srid, name, deg, info, p, rank = row.values()
+                if src == 'c':
+                    # Обрабатываем результаты из custom_geom
+                    # Определяем значение достоверности как в координатном поиске
+                    if str(srid).startswith('326'):
+                        p_value = "EPSG"
+                    else:
+                        p_value = p if p is not None else "unknown"
+                    
+                    # Отладочная информация
+                    self._logger.debug("Custom result: srid=%s, name='%s', info='%s', p='%s'",
+                                       srid, name, info, p)
+                    
+                    formatted_results.append({
+                        'srid': srid,
+                        'name': name,  # Используем name из custom_geom
+                        'info': info,  # Используем info как описание
+                        'p': p_value,  # Достоверность
+                        'deg': deg,  # Степень точности
+                        # Для обратной совместимости с остальным кодом
+                        'auth_name': p_value,
+                        'auth_srid': srid,
+                        'srtext': info,
+                        'proj4text': info,
+                        'description': info,
+                        'cursor': (src, rank, srid)
+                    })
                 else:
-                    p_value = row['p'] if row['p'] is not None else "unknown"
-                
-                # Отладочная информация
-                self._logger.debug(f"Custom result: srid={row['srid']}, name='{row['name']}', info='{row['info']}', p='{row['p']}'")
-                
-                formatted_results.append({
-                    'srid': row['srid'],
-                    'name': row['name'],  # Используем name из custom_geom
-                    'info': row['info'],  # Используем info как описание
-                    'p': p_value,  # Достоверность
-                    'deg': row['deg'],  # Степень точности
-                    # Для обратной совместимости с остальным кодом
-                    'auth_name': p_value,
-                    'auth_srid': row['srid'],
-                    'srtext': row['info'],
-                    'proj4text': row['info'],
-                    'description': row['info']
-                })
-            
-            # Обрабатываем UTM результаты из spatial_ref_sys
-            for row in results_utm:
-                srid = row['srid']
-                # Вычисляем номер UTM зоны из SRID
-                utm_zone = srid - 32600
-                name = f"UTM zone {utm_zone}N"
-                description = "WGS84"
-                
-                formatted_results.append({
-                    'srid': srid,
-                    'name': name,
-                    'info': description,
-                    'p': "EPSG",  # UTM системы всегда EPSG
-                    'deg': 6,  # Стандартная степень для UTM
-                    # Для обратной совместимости с остальным кодом
-                    'auth_name': "EPSG",
-                    'auth_srid': srid,
-                    'srtext': description,
-                    'proj4text': description,
-                    'description': description
-                })
-            
-            return formatted_results
+                    # Обрабатываем UTM результаты из spatial_ref_sys:
+                    # постоянные поля берутся из шаблона, номер зоны вычисляется из SRID
+                    formatted_results.append({
+                        **_UTM_RESULT_TEMPLATE,
+                        'srid': srid,
+                        'name': f"UTM zone {srid - 32600}N",
+                        'auth_srid': srid,
+                        'cursor': (src, rank, srid)
+                    })
+            
+            return formatted_results, len(rows) > self.items_per_page
             
         except Exception as e:
             self._logger.error(f"Ошибка при выполнении поиска: {e}")
-            if hasattr(self, '_metrics') and self._metrics:
+            if self._metrics:
                 await self._metrics.record_error('search_query', str(e))
             raise
             
-    async def _show_search_results(self, update: Update, context: ContextTypes.DEFAULT_TYPE, results: List[Dict[str, Any]]) -> None:
+    async def _show_search_results(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
+                                   results: List[Dict[str, Any]], page: Dict[str, Any]) -> None:
         """
         Отображение результатов поиска
         
@@ -345,51 +615,38 @@ class SearchHandler(BaseHandler):
             update: Обновление от Telegram
             context: Контекст обработчика
             results: Результаты поиска
+            page: Состояние пагинации, сохраненное _store_page
         """
         if not results:
-            await update.message.reply_text(
-                "🔍 По вашему запросу ничего не найдено.\n"
-                "Попробуйте изменить параметры поиска или ввести другой запрос."
-            )
+            await update.effective_message.reply_text(_NO_RESULTS_TEXT)
             return
             
-        # Получаем текущую страницу
-        user_data = await self._get_user_data(context)
-        current_page = user_data.get('current_page', 0)
-        
-        # Пагинация результатов
-        start_idx = current_page * self.items_per_page
-        end_idx = start_idx + self.items_per_page
-        page_results = results[start_idx:end_idx]
-        
-        # Формируем сообщение с результатами
-        message_text = "🔍 Результаты поиска:\n\n"
-        for idx, result in enumerate(page_results, start=1):
-            message_text += (
-                f"{idx}. SRID: {result['srid']}\n"
+        # Состояние пагинации берется из только что сохраненной страницы
+        has_prev = len(page['page_cursor']) > 1
+        has_next = page['next_cursor'] is not None
+        
+        # Формируем текст сообщения и кнопки выбора результата за один проход
+        lines = ["🔍 Результаты поиска:\n\n"]
+        keyboard = []
+        for idx, result in enumerate(results, start=1):
+            srid = result['srid']
+            lines.append(
+                f"{idx}. SRID: {srid}\n"
                 f"Название: {result['name']}\n"
                 f"Описание: {result['description'][:100]}...\n\n"
             )
-            
-        # Создаем клавиатуру для навигации
-        keyboard = []
-        
-        # Кнопки для выбора результата
-        for idx, result in enumerate(page_results, start=1):
             keyboard.append([
-                InlineKeyboardButton(
-                    f"Выбрать {idx}",
-                    callback_data=f"select_srid_{result['srid']}"
-                )
+                InlineKeyboardButton(f"Выбрать {idx}", callback_data=f"{_SELECT_SRID_PREFIX}{srid}")
             ])
+        message_text = "".join(lines)
             
         # Кнопки пагинации
         navigation = []
-        if current_page > 0:
+        if has_prev:
             navigation.append(
                 InlineKeyboardButton("⬅️ Назад", callback_data="prev_page")
             )
-        if end_idx < len(results):
+        if has_next:
             navigation.append(
                 InlineKeyboardButton("Вперед ➡️", callback_data="next_page")
             )
@@ -403,7 +660,7 @@ class SearchHandler(BaseHandler):
         
         reply_markup = InlineKeyboardMarkup(keyboard)
         
-        await update.message.reply_text(
+        await update.effective_message.reply_text(
             message_text,
             reply_markup=reply_markup
         )
@@ -423,28 +680,13 @@ class SearchHandler(BaseHandler):
         await query.answer()
         
         try:
-            if query.data == "back_to_menu":
-                await query.message.edit_reply_markup(reply_markup=None)
-                return States.MAIN_MENU
+            data = query.data
+            handler_name = self._CB_STATIC.get(data)
+            if handler_name is not None:
+                return await getattr(self, handler_name)(update, context)
                 
-            elif query.data == "prev_page":
-                user_data = await self._get_user_data(context)
-                current_page = user_data.get('current_page', 0)
-                if current_page > 0:
-                    await self._update_user_data(context, {'current_page': current_page - 1})
-                    results = user_data.get('search_results', [])
-                    await self._show_search_results(update, context, results)
-                    
-            elif query.data == "next_page":
-                user_data = await self._get_user_data(context)
-                current_page = user_data.get('current_page', 0)
-                results = user_data.get('search_results', [])
-                if (current_page + 1) * self.items_per_page < len(results):
-                    await self._update_user_data(context, {'current_page': current_page + 1})
-                    await self._show_search_results(update, context, results)
-                    
-            elif query.data.startswith("select_srid_"):
-                srid = query.data.split("_")[-1]
+            if data.startswith(_SELECT_SRID_PREFIX):
+                srid = data[_SELECT_SRID_PREFIX_LEN:]
                 await self._update_user_data(context, {'selected_srid': srid})
                 await query.message.edit_text(
                     f"✅ Выбрана система координат с SRID: {srid}\n"
@@ -462,30 +704,77 @@ class SearchHandler(BaseHandler):
             await self._handle_error(update, context, e)
             return States.SEARCH_ERROR
             
+    async def _store_page(self, context: CallbackContext, query: str,
+                          cursors: List[Tuple[str, int, int]], results: List[Dict[str, Any]],
+                          has_next: bool) -> Dict[str, Any]:
+        """
+        Сохранение состояния пагинации в данных пользователя
+        
+        Args:
+            context: Контекст обработчика
+            query: Поисковый запрос
+            cursors: Стек курсоров просмотренных страниц (последний - текущая)
+            results: Результаты текущей страницы
+            has_next: Есть ли следующая страница
+            
+        Returns:
+            Dict[str, Any]: Сохраненное состояние пагинации
+        """
+        page = {
+            'query': query,
+            'page_cursor': cursors,
+            'next_cursor': results[-1]['cursor'] if has_next else None,
+            'srids': [r['srid'] for r in results]
+        }
+        await self._update_user_data(context, page)
+        return page
+        
+    async def _on_back_to_menu(self, update: Update, context: CallbackContext) -> States:
+        """Возврат в главное меню из результатов поиска"""
+        await update.callback_query.message.edit_reply_markup(reply_markup=None)
+        return States.MAIN_MENU
+        
+    async def _on_prev_page(self, update: Update, context: CallbackContext) -> States:
+        """Переход на предыдущую страницу результатов"""
+        user_data = await self._get_user_data(context)
+        cursors = list(user_data.get('page_cursor') or ())
+        query = user_data.get('query')
+        if query and len(cursors) > 1:
+            cursors.pop()
+            results, has_next = await self._perform_search(query, {}, cursors[-1])
+            page = await self._store_page(context, query, cursors, results, has_next)
+            await self._show_search_results(update, context, results, page)
+        return States.SEARCH_RESULTS
+        
+    async def _on_next_page(self, update: Update, context: CallbackContext) -> States:
+        """Переход на следующую страницу результатов"""
+        user_data = await self._get_user_data(context)
+        next_cursor = user_data.get('next_cursor')
+        query = user_data.get('query')
+        if query and next_cursor is not None:
+            cursors = list(user_data.get('page_cursor') or (_FIRST_PAGE_CURSOR,))
+            cursors.append(next_cursor)
+            results, has_next = await self._perform_search(query, {}, next_cursor)
+            page = await self._store_page(context, query, cursors, results, has_next)
+            await self._show_search_results(update, context, results, page)
+        return States.SEARCH_RESULTS
+            
     def _get_export_keyboard(self) -> InlineKeyboardMarkup:
         """
-        Создание клавиатуры для выбора формата экспорта
+        Клавиатура для выбора формата экспорта
         
         Returns:
             InlineKeyboardMarkup: Клавиатура с форматами экспорта
         """
-        keyboard = [
-            [
-                InlineKeyboardButton("Civil 3D", callback_data="export_civil3d"),
-                InlineKeyboardButton("GMv20", callback_data="export_gmv20")
-            ],
-            [
-                InlineKeyboardButton("GMv25", callback_data="export_gmv25")
-            ],
-            [
-                InlineKeyboardButton("🔙 В меню", callback_data="back_to_menu")
-            ]
-        ]
-        return InlineKeyboardMarkup(keyboard)
+        return self._EXPORT_MARKUP
 
-    def _get_export_keyboard_for_srid(self, srid: str) -> InlineKeyboardMarkup:
+    @staticmethod
+    @functools.lru_cache(maxsize=_EXPORT_MARKUP_CACHE_SIZE)
+    def _get_export_keyboard_for_srid(srid: str) -> InlineKeyboardMarkup:
         """
-        Создание клавиатуры с кнопками экспорта для конкретного SRID (inline режим)
+        Клавиатура с кнопками экспорта для конкретного SRID (inline режим)
+        
+        Разметка неизменяема, поэтому кэшируется по SRID.
         
         Args:
             srid: SRID системы координат
@@ -495,9 +784,9 @@ class SearchHandler(BaseHandler):
         """
         keyboard = [
             [
-                InlineKeyboardButton("📄 Civil3D", callback_data=f"inline_export_xml_Civil3D_{srid}"),
-                InlineKeyboardButton("📋 GMv20", callback_data=f"inline_export_prj_GMV20_{srid}"),
-                InlineKeyboardButton("📋 GMv25", callback_data=f"inline_export_prj_GMV25_{srid}")
+                InlineKeyboardButton("📄 Civil3D", callback_data=f"inline_export_xml_civil3d_{srid}"),
+                InlineKeyboardButton("📋 GMv20", callback_data=f"inline_export_prj_gmv20_{srid}"),
+                InlineKeyboardButton("📋 GMv25", callback_data=f"inline_export_prj_gmv25_{srid}")
             ]
         ]
         return InlineKeyboardMarkup(keyboard)
@@ -516,7 +805,12 @@ class SearchHandler(BaseHandler):
 
         try:
             if self.enhanced_search_engine:
-                results = await self.enhanced_search_engine.search(query, limit=10)
+                # Регистр в ключе сохраняется: движок учитывает исходное написание
+                search_query = query.strip()
+                results = await self._cached_search(
+                    f"inline:{search_query}",
+                    lambda: self._inline_engine_search(search_query)
+                )
             else:
                 if self._logger:
                     self._logger.error("EnhancedSearchEngine не инициализирован в SearchHandler для инлайн-поиска.")
@@ -526,56 +820,57 @@ class SearchHandler(BaseHandler):
             if self._logger:
                  self._logger.info(f"EnhancedSearchEngine вернул {len(results)} результатов для инлайн-запроса: '{query}'")
 
+            # Локальные ссылки: атрибуты и глобальные имена разрешаются один раз, а не на каждый результат
+            article_cls = InlineQueryResultArticle
+            content_cls = InputTextMessageContent
+            export_keyboard = self._get_export_keyboard_for_srid
+            format_text = _INLINE_TEMPLATE.format_map
+            mdv2 = _MDV2
+            markdown_v2 = ParseMode.MARKDOWN_V2
+            
             articles = []
+            append_article = articles.append
             for res in results:
                 srid = res.get('srid')
+                srid_str = str(srid)
                 # Используем новые поля name и description
                 name_val = str(res.get('name', f'SRID: {srid}'))
                 description_val = str(res.get('description', 'Описание отсутствует'))
-                # auth_name_val = str(res.get('auth_name', 'unknown')) # Больше не используем для достоверности
 
                 # Получаем и форматируем значение 'p'
                 p_value = res.get('p')
-                p_value_str = "unknown" # Значение по умолчанию
                 if isinstance(p_value, bool):
                     p_value_str = str(p_value).lower()
                 elif p_value is not None: # Если не bool, но не None, берем как строку
                     p_value_str = str(p_value)
+                else:
+                    p_value_str = "unknown" # Значение по умолчанию
 
-                # Экранирование для MarkdownV2
-                escaped_srid = escape_markdown_v2(str(srid))
-                escaped_name_val = escape_markdown_v2(name_val)
-                escaped_description_val = escape_markdown_v2(description_val)
-                escaped_p_val = escape_markdown_v2(p_value_str) # Экранируем отформатированное значение p
-
-                input_text_content = (
-                    f"🔷 *SRID:* `{escaped_srid}`\n"
-                    f"📝 *Название:* {escaped_name_val}\n"
-                    f"ℹ️ *Описание:* {escaped_description_val}\n"
-                    f"✅ *Достоверность:* {escaped_p_val}" # Используем экранированное значение p
-                )
-                
                 # Для отображения в списке инлайн-результатов:
                 # title - краткое название
-                # description - SRID и часть полного описания
-                # Ограничиваем длину description для инлайн отображения
-                inline_description_preview = f"SRID: {srid} ({description_val[:50]}{'...' if len(description_val) > 50 else ''})"
-
-                articles.append(
-                    InlineQueryResultArticle(
-                        id=str(srid),
-                        title=name_val, # Краткое имя для заголовка
-                        description=inline_description_preview, # SRID и часть полного описания для подписи
-                        input_message_content=InputTextMessageContent(
-                            input_text_content,
-                            parse_mode=ParseMode.MARKDOWN_V2
-                        ),
-                        reply_markup=self._get_export_keyboard_for_srid(str(srid)) # Добавляем кнопки экспорта
-                    )
-                )
+                # description - SRID и часть полного описания (не длиннее 50 символов)
+                append_article(article_cls(
+                    id=srid_str,
+                    title=name_val,
+                    description=f"SRID: {srid} ({description_val[:50]}{'...' if len(description_val) > 50 else ''})",
+                    input_message_content=content_cls(
+                        # Экранирование для MarkdownV2 и подстановка в шаблон за один вызов
+                        format_text({
+                            'srid': srid_str.translate(mdv2),
+                            'name': name_val.translate(mdv2),
+                            'description': description_val.translate(mdv2),
+                            'p': p_value_str.translate(mdv2),
+                        }),
+                        parse_mode=markdown_v2
+                    ),
+                    reply_markup=export_keyboard(srid_str) # Добавляем кнопки экспорта
+                ))
             await update.inline_query.answer(articles, cache_time=300)
         except Exception as e:
-            if self._logger:
+            if isinstance(e, _TRANSIENT_TELEGRAM_ERRORS):
+                # Ожидаемые ошибки Telegram API: трассировка не нужна
+                self._logger.warning("Ошибка Telegram API при ответе на инлайн-запрос '%s': %s", query, e)
+            elif self._logger:
                 self._logger.exception(f"Ошибка при обработке инлайн-запроса '{query}': {e}")
             try:
                 await update.inline_query.answer([], cache_time=5)
@@ -583,6 +878,11 @@ class SearchHandler(BaseHandler):
                  if self._logger:
                     self._logger.exception(f"Критическая ошибка при отправке ответа на инлайн-запрос: {ex_answer}")
 
+    async def _inline_engine_search(self, query: str) -> List[Dict[str, Any]]:
+        """Поиск для инлайн-режима через EnhancedSearchEngine с ограничением нагрузки на БД"""
+        async with self._db_semaphore:
+            return await self.enhanced_search_engine.search(query, limit=10)
+
     def _filter_problematic_variants(self, original_query: str, variants: List[str]) -> List[str]:
         """
         Фильтрует проблемные варианты, которые могут давать слишком широкие результаты
@@ -596,30 +896,20 @@ class SearchHandler(BaseHandler):
         """
         filtered_variants = []
         
-        # Определяем, является ли исходный запрос полным (содержит номер зоны)
+        # Определяем, является ли исходный запрос полным (содержит номер зоны):
+        # цифра сразу после 'z' или 'з'
         original_lower = original_query.lower()
-        has_zone_number = any(char.isdigit() and original_lower[i-1:i+1] in ['z1', 'з1', 'z2', 'з2', 'z3', 'з3', 'z4', 'з4', 'z5', 'з5', 'z6', 'з6', 'z7', 'з7', 'z8', 'з8', 'z9', 'з9'] or
-                             (char.isdigit() and i > 0 and original_lower[i-1] in ['z', 'з']) 
-                             for i, char in enumerate(original_lower))
+        has_zone_number = any(
+            char.isdigit() and prev in 'zз'
+            for prev, char in zip(original_lower, original_lower[1:])
+        )
         
         for variant in variants:
-            variant_lower = variant.lower()
-            
             # Пропускаем базовые варианты GSK/MSK без номера зоны если исходный запрос содержал номер
-            if has_zone_number:
-                # Список проблемных базовых вариантов
-                problematic_bases = ['gsk11', 'гск11', 'msk', 'мск', 'sk42', 'ск42', 'sk95', 'ск95', 'sk63', 'ск63']
-                
-                # Проверяем, является ли вариант проблемным базовым
-                is_problematic = False
-                for base in problematic_bases:
-                    if variant_lower == base or variant.upper() == base.upper():
-                        is_problematic = True
-                        self._logger.debug(f"Отфильтрован проблемный базовый вариант: '{variant}'")
-                        break
-                
-                if is_problematic:
-                    continue
+            if has_zone_number and (variant.lower() in _PROBLEMATIC_BASES
+                                    or variant.upper() in _PROBLEMATIC_BASES_UPPER):
+                self._logger.debug(f"Отфильтрован проблемный базовый вариант: '{variant}'")
+                continue
             
             # Добавляем остальные варианты
             filtered_variants.append(variant)
@@ -627,9 +917,9 @@ class SearchHandler(BaseHandler):
         # Если после фильтрации осталось мало вариантов, оставляем самые релевантные
         if len(filtered_variants) < 5:
             # Добавляем обратно несколько самых близких к оригинальному запросу
-            remaining_variants = [v for v in variants if v not in filtered_variants]
-            for variant in remaining_variants[:3]:  # Добавляем максимум 3 дополнительных варианта
-                filtered_variants.append(variant)
+            kept = set(filtered_variants)
+            remaining_variants = [v for v in variants if v not in kept]
+            filtered_variants.extend(remaining_variants[:3])  # Добавляем максимум 3 дополнительных варианта
         
         return filtered_variants 
 
@@ -660,7 +950,7 @@ class SearchHandler(BaseHandler):
                 return States.SEARCH_INPUT
             except Exception as e:
                 self._logger.error(f"Ошибка при обработке поискового запроса: {e}", exc_info=True)
-                await update.message.reply_text("Произошла ошибка при поиске. Попробуйте еще раз.")
+                await update.message.reply_text(_SEARCH_RETRY_ERROR_TEXT)
                 return States.SEARCH_INPUT
         
         return States.SEARCH_INPUT
@@ -673,25 +963,22 @@ class SearchHandler(BaseHandler):
         await query.edit_message_text(text=f"Выбрана пагинация: {query.data}. Логика не реализована.")
         return States.SEARCH_RESULTS
 
-    async def handle_inline_result(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        """
-        Обрабатывает 'эхо' от выбора инлайн-результата.
-        """
-        user_id = update.effective_user.id
-        self._logger.info(f"[SearchHandler.handle_inline_result] Проигнорировано 'эхо' инлайн-результата для user_id={user_id}.")
-        # Ничего не возвращаем, просто поглощаем обновление
-
     async def handle_inline_result_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> States:
         """
         Обрабатывает сообщения с inline результатами (начинающиеся с "🔷 SRID:").
         Возвращает текущее состояние поиска без изменений.
         """
-        if update.message and update.message.text:
-            user_id = update.effective_user.id
-            text_preview = update.message.text[:50] + "..." if len(update.message.text) > 50 else update.message.text
-            self._logger.info(f"[SearchHandler.handle_inline_result_message] Игнорирую inline результат для user_id={user_id}: {text_preview}")
+        # Возвращаем текущее состояние без изменений - остаемся в режиме поиска.
+        # Превью текста строится только если сообщение действительно попадет в лог
+        if not self._logger.isEnabledFor(logging.INFO):
+            return States.SEARCH_INPUT
+        
+        text = update.message.text if update.message else None
+        if text:
+            text_preview = text if len(text) <= 50 else text[:50] + "..."
+            self._logger.info("[SearchHandler.handle_inline_result_message] Игнорирую inline результат для user_id=%s: %s",
+                              update.effective_user.id, text_preview)
         
-        # Возвращаем текущее состояние без изменений - остаемся в режиме поиска
         return States.SEARCH_INPUT
 
     async def handle_inline_export_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -709,31 +996,42 @@ class SearchHandler(BaseHandler):
                 self._logger.warning("handle_inline_export_callback получен без данных.")
                 return
 
-            parts = query.data.split('_')
-            if len(parts) < 5:
+            match = _INLINE_EXPORT_RE.match(query.data)
+            if not match:
                 self._logger.warning(f"Некорректный callback_data в inline экспорте: {query.data}")
                 return
 
-            _, _, export_type, format_name, srid = parts
+            export_type, format_name, srid = match.group('type', 'fmt', 'srid')
+            export_format = _INLINE_EXPORT_FORMATS.get(format_name)
+            if export_format is None:
+                self._logger.warning(f"Неизвестный формат в inline экспорте: {query.data}")
+                return
+            user_id = query.from_user.id
             
-            self._logger.info(f"[SearchHandler.handle_inline_export_callback] user_id={query.from_user.id}, type={export_type}, format={format_name}, srid={srid}")
+            self._logger.info(f"[SearchHandler.handle_inline_export_callback] user_id={user_id}, type={export_type}, format={format_name}, srid={srid}")
             
             # Преобразуем callback_data в формат, понятный CoordExportHandler.
-            # Например, из 'inline_export_prj_GMV25_100619' в 'export_gmv25_100619'.
+            # Например, из 'inline_export_prj_gmv25_100619' в 'export_gmv25_100619'.
             # Ожидаемый формат: export_{format}_{srid}
-            new_callback_data = f"export_{format_name.lower()}_{srid}"
+            new_callback_data = f"export_{export_format}_{srid}"
             
             self._logger.info(f"Делегирую экспорт в CoordExportHandler с новой callback_data: {new_callback_data}")
 
             if self.coord_export_handler:
-                await self.coord_export_handler.handle_export_callback(update, context, custom_callback_data=new_callback_data)
+                # Экспорты одного пользователя выполняются по очереди, разных - параллельно
+                async with self._user_lock(user_id):
+                    await self.coord_export_handler.handle_export_callback(update, context, custom_callback_data=new_callback_data)
             else:
                 self._logger.error("coord_export_handler не инициализирован в SearchHandler.")
                 if query.message:
                     await query.message.reply_text("❌ Ошибка конфигурации: сервис экспорта не доступен.")
 
         except Exception as e:
-            self._logger.error(f"Критическая ошибка в handle_inline_export_callback: {e}", exc_info=True)
+            if isinstance(e, _TRANSIENT_TELEGRAM_ERRORS):
+                # Ожидаемые ошибки Telegram API: трассировка не нужна
+                self._logger.warning("Ошибка Telegram API в handle_inline_export_callback: %s", e)
+            else:
+                self._logger.error(f"Критическая ошибка в handle_inline_export_callback: {e}", exc_info=True)
             if query and query.message:
                 try:
                     await query.edit_message_text("❌ Произошла ошибка при обработке экспорта.")
@@ -742,9 +1040,8 @@ class SearchHandler(BaseHandler):
 
     async def cancel_search(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> States:
         """Отменяет операцию поиска и возвращает в главное меню."""
-        self._logger.info(f"Пользователь {update.effective_user.id} отменил поиск.")
-        user_id = update.effective_user.id
-        self._logger.info(f"[SearchHandler.cancel_search] user_id={user_id}")
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("[SearchHandler.cancel_search] Пользователь %s отменил поиск.", update.effective_user.id)
         
         if self.menu_handler:
             await self.menu_handler.show_main_menu(update, context)
@@ -754,10 +1051,8 @@ class SearchHandler(BaseHandler):
     def get_handler(self) -> ConversationHandler:
         """Возвращает настроенный ConversationHandler для всего диалога поиска."""
         
-        back_button_text = MainKeyboard.BUTTON_MENU
-
-        # Создаем фильтр для inline результатов (сообщения, начинающиеся с "🔷 SRID:")
-        inline_result_filter = filters.Regex(r'^🔷 SRID:')
+        # Один обработчик кнопки возврата в меню используется во всех состояниях и в fallbacks
+        back_handler = MessageHandler(_BACK_FILTER, self.cancel_search)
         
         handler = ConversationHandler(
             entry_points=[
@@ -766,21 +1061,21 @@ class SearchHandler(BaseHandler):
             states={
                 States.SEARCH_INPUT: [
                     # Сначала обрабатываем кнопку возврата в меню
-                    MessageHandler(filters.Text([back_button_text]), self.cancel_search),
+                    back_handler,
                     # Затем обрабатываем inline результаты (игнорируем их)
-                    MessageHandler(inline_result_filter, self.handle_inline_result_message),
+                    MessageHandler(_INLINE_RESULT_FILTER, self.handle_inline_result_message),
                     # Остальные текстовые сообщения обрабатываем как поисковые запросы
                     MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_filter_input),
                 ],
                 States.SEARCH_RESULTS: [
                     CallbackQueryHandler(self.handle_pagination_callback, pattern=r"^page_"),
                     CallbackQueryHandler(self.handle_filter_callback, pattern=r"^filter_"),
-                    MessageHandler(filters.Text([back_button_text]), self.cancel_search)
+                    back_handler
                 ]
             },
             fallbacks=[
                 CommandHandler("cancel", self.cancel_search),
-                MessageHandler(filters.Text([back_button_text]), self.cancel_search)
+                back_handler
             ],
             map_to_parent={
                 ConversationHandler.END: States.MAIN_MENU,
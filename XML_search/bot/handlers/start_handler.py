@@ -8,10 +8,14 @@ from telegram.ext import ContextTypes
 from XML_search.bot.handlers.base_handler import BaseHandler
 from XML_search.bot.config import BotConfig
 from XML_search.bot.states import States
+from XML_search.bot.keyboards.main_keyboard import MainKeyboard
 from XML_search.enhanced.metrics_manager import MetricsManager
 from XML_search.enhanced.log_manager import LogManager
 from XML_search.enhanced.cache_manager import CacheManager
 
+# Клавиатура главного меню: готовая разметка, общая для всех вызовов /start
+_MAIN_MENU_MARKUP = MainKeyboard.get_cached_keyboard()
+
 class StartHandler(BaseHandler):
     """Обработчик команды /start"""
     
@@ -64,19 +68,7 @@ class StartHandler(BaseHandler):
         if not update.effective_chat:
             return
             
-        # Создаем клавиатуру главного меню
-        keyboard = [
-            ["🔍 Поиск по координатам"],
-            ["📝 Поиск по описанию"],
-            ["❓ Помощь"]
-        ]
-        
-        reply_markup = {
-            'keyboard': keyboard,
-            'resize_keyboard': True
-        }
-        
         await update.effective_chat.send_message(
             "Выберите действие:",
-            reply_markup=reply_markup
+            reply_markup=_MAIN_MENU_MARKUP
         ) 
\ No newline at end of file
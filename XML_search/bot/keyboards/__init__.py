@@ -10,7 +10,7 @@ from .main_keyboard import (
     BUTTON_EXPORT_GMV20,
     BUTTON_EXPORT_GMV25
 )
-from .base_keyboard import BaseKeyboard
+from .base import BaseKeyboard
 
 __all__ = [
     'MainKeyboard',
@@ -2,17 +2,37 @@
 Базовые классы для клавиатур
 """
 
-from typing import Dict, Any, List, Optional
+import time
+import logging
+from functools import cached_property, lru_cache
+from typing import Dict, Any, List, Mapping, Optional, Union, TYPE_CHECKING
 from dataclasses import dataclass
-from telegram import InlineKeyboardMarkup
-from XML_search.enhanced.metrics_manager import MetricsManager
-from XML_search.enhanced.log_manager import LogManager
+from telegram import ReplyKeyboardMarkup, InlineKeyboardMarkup, InlineKeyboardButton
 
-@dataclass
+if TYPE_CHECKING:
+    from XML_search.enhanced.metrics_manager import MetricsManager
+
+@lru_cache(maxsize=1)
+def _shared_metrics() -> "MetricsManager":
+    """Общий для всех клавиатур менеджер метрик (создается при первом обращении)"""
+    from XML_search.enhanced.metrics_manager import MetricsManager
+    return MetricsManager()
+
+@lru_cache(maxsize=None)
+def _module_logger(module_name: str) -> logging.Logger:
+    """Логгер модуля клавиатуры, общий для всех ее экземпляров"""
+    from XML_search.enhanced.log_manager import LogManager
+    return LogManager().get_logger(module_name)
+
+@dataclass(slots=True, frozen=True)
 class KeyboardResult:
-    """Результат построения клавиатуры"""
+    """
+    Результат построения клавиатуры (неизменяемый, без __dict__ у экземпляров)
+    
+    metadata - словарь либо NamedTuple с полями, заданными клавиатурой
+    """
     keyboard: InlineKeyboardMarkup
-    metadata: Dict[str, Any]
+    metadata: Union[Mapping[str, Any], tuple]
 
 class BaseKeyboard:
     """Базовый класс для клавиатур"""
@@ -25,8 +45,16 @@ class BaseKeyboard:
             keyboard_type: Тип клавиатуры
         """
         self.keyboard_type = keyboard_type
-        self.metrics = MetricsManager()
-        self.logger = LogManager().get_logger(__name__)
+        
+    @cached_property
+    def metrics(self) -> "MetricsManager":
+        """Менеджер метрик, общий для всех клавиатур"""
+        return _shared_metrics()
+        
+    @cached_property
+    def logger(self) -> logging.Logger:
+        """Логгер модуля клавиатуры (создается при первом обращении)"""
+        return _module_logger(self.__class__.__module__)
         
     def build(self, **kwargs) -> KeyboardResult:
         """
@@ -43,6 +71,50 @@ class BaseKeyboard:
         """
         raise NotImplementedError("Метод build должен быть переопределен")
         
+    def create_keyboard(self, buttons: List[List[Dict[str, str]]]) -> ReplyKeyboardMarkup:
+        """
+        Создание обычной клавиатуры
+        
+        Args:
+            buttons: Список списков с описанием кнопок
+            
+        Returns:
+            Объект клавиатуры
+        """
+        keyboard = []
+        for row in buttons:
+            keyboard_row = []
+            for button in row:
+                keyboard_row.append(button['text'])
+            keyboard.append(keyboard_row)
+        return ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+        
+    def create_inline_keyboard(self, buttons: List[List[Dict[str, str]]]) -> InlineKeyboardMarkup:
+        """
+        Создание inline-клавиатуры
+        
+        Args:
+            buttons: Список списков с описанием кнопок
+            
+        Returns:
+            Объект inline-клавиатуры
+        """
+        keyboard = []
+        for row in buttons:
+            keyboard_row = []
+            for button in row:
+                keyboard_row.append(
+                    InlineKeyboardButton(
+                        text=button['text'],
+                        callback_data=button.get('callback_data'),
+                        url=button.get('url'),
+                        switch_inline_query=button.get('switch_inline_query'),
+                        switch_inline_query_current_chat=button.get('switch_inline_query_current_chat')
+                    )
+                )
+            keyboard.append(keyboard_row)
+        return InlineKeyboardMarkup(keyboard)
+        
     def validate_callback_data(self, callback_data: str) -> bool:
         """
         Валидация callback_data
@@ -114,6 +186,10 @@ class BaseKeyboard:
             Очищенный текст
         """
         try:
+            # Обычно текст кнопки уже печатаемый: проверка всей строки выполняется
+            # одним вызовом на C, посимвольный проход нужен только при спецсимволах
+            if text.isprintable():
+                return text[:max_length]
             # Удаляем спецсимволы
             sanitized = ''.join(c for c in text if c.isprintable())
             # Обрезаем до максимальной длины
@@ -123,14 +199,18 @@ class BaseKeyboard:
             self.logger.error(f"Ошибка санитизации текста: {e}")
             return text[:max_length]  # Возвращаем обрезанный текст в случае ошибки
             
-    def _get_metadata(self) -> Dict[str, Any]:
+    def _get_metadata(self, with_timestamp: bool = False) -> Dict[str, Any]:
         """
         Получение метаданных клавиатуры
         
+        Args:
+            with_timestamp: Добавить время построения (обычно не читается,
+                поэтому по умолчанию часы не опрашиваются)
+        
         Returns:
             Словарь с метаданными
         """
-        return {
-            'type': self.keyboard_type,
-            'timestamp': self.metrics.get_current_timestamp()
-        } 
\ No newline at end of file
+        metadata: Dict[str, Any] = {'type': self.keyboard_type}
+        if with_timestamp:
+            metadata['timestamp'] = time.time()
+        return metadata 
\ No newline at end of file
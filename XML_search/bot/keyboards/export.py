@@ -2,12 +2,15 @@
 Клавиатура экспорта форматов
 """
 
+import functools
 from typing import Optional, Dict
 from telegram import InlineKeyboardMarkup, InlineKeyboardButton
-from XML_search.enhanced.metrics_manager import MetricsManager
-from XML_search.enhanced.log_manager import LogManager
 from .base import BaseKeyboard, KeyboardResult
 
+# Максимальный SRID в PostGIS и лимит Telegram на длину callback_data
+_MAX_SRID = 999999
+_CALLBACK_DATA_MAX_BYTES = 64
+
 class ExportKeyboard(BaseKeyboard):
     """Клавиатура для экспорта в разные форматы"""
     
@@ -30,6 +33,11 @@ class ExportKeyboard(BaseKeyboard):
         }
     }
     
+    # Пары (идентификатор, подпись) доступных форматов, вычисляются один раз:
+    # для анонимного пользователя и для пользователя с ID
+    _PUBLIC = tuple((fid, info['label']) for fid, info in FORMATS.items() if not info['requires_auth'])
+    _AUTHED = tuple((fid, info['label']) for fid, info in FORMATS.items())
+    
     def build(self, srid: int, user_id: Optional[int] = None) -> KeyboardResult:
         """
         Построение клавиатуры экспорта
@@ -46,61 +54,77 @@ class ExportKeyboard(BaseKeyboard):
         """
         try:
             # Валидация SRID
-            if not isinstance(srid, int) or srid <= 0:
+            if not isinstance(srid, int) or not 0 < srid <= _MAX_SRID:
                 raise ValueError(f"Невалидный SRID: {srid}")
             
-            buttons = []
-            row = []
-            
-            # Создаем кнопки для каждого формата
-            for format_id, info in self.FORMATS.items():
-                # Проверяем права доступа
-                if not info['requires_auth'] or user_id is not None:
-                    button = InlineKeyboardButton(
-                        info['label'],
-                        callback_data=f"export_{format_id}:{srid}"
-                    )
-                    row.append(button)
-                    
-                    # Формируем ряды по 2 кнопки
-                    if len(row) == 2:
-                        buttons.append(row)
-                        row = []
-            
-            # Добавляем оставшиеся кнопки
-            if row:
-                buttons.append(row)
-                
-            # Добавляем кнопку возврата в меню
-            buttons.append([
-                InlineKeyboardButton(
-                    "🔙 Назад",
-                    callback_data="menu"
-                )
-            ])
-            
-            # Валидируем кнопки
-            for row in buttons:
-                if not self._validate_buttons([row]):
-                    raise ValueError("Ошибка валидации кнопок")
+            authed = user_id is not None
+            markup = _build_markup(srid, authed)
             
             # Отслеживаем метрики
             self._track_build('export')
             
             return KeyboardResult(
-                keyboard=InlineKeyboardMarkup(buttons),
+                keyboard=markup,
                 metadata={
                     'type': 'export',
                     'srid': srid,
                     'user_id': user_id,
-                    'available_formats': [
-                        format_id for format_id, info in self.FORMATS.items()
-                        if not info['requires_auth'] or user_id is not None
-                    ]
+                    'available_formats': [fid for fid, _ in (self._AUTHED if authed else self._PUBLIC)]
                 }
             )
             
         except Exception as e:
             self._track_build('export', success=False)
             self.logger.error(f"Ошибка создания клавиатуры экспорта: {e}")
-            raise 
\ No newline at end of file
+            raise
+
+
+# Кнопки строятся из констант класса, поэтому длина callback_data проверяется
+# один раз при импорте, а не при каждом построении клавиатуры
+if any(
+    len(f"export_{format_id}:{_MAX_SRID}".encode()) > _CALLBACK_DATA_MAX_BYTES
+    for format_id in ExportKeyboard.FORMATS
+):
+    raise ValueError("callback_data кнопок экспорта превышает лимит Telegram")
+
+
+@functools.lru_cache(maxsize=2048)
+def _build_markup(srid: int, authed: bool) -> InlineKeyboardMarkup:
+    """
+    Построение разметки клавиатуры экспорта
+    
+    Разметка зависит только от SRID и наличия авторизации и неизменяема,
+    поэтому кэшируется: популярные SRID не пересобираются при каждом экспорте.
+    
+    Args:
+        srid: SRID системы координат
+        authed: Передан ли ID пользователя
+        
+    Returns:
+        Разметка клавиатуры экспорта
+    """
+    buttons = []
+    row = []
+    
+    # Создаем кнопки для каждого доступного формата
+    for format_id, label in (ExportKeyboard._AUTHED if authed else ExportKeyboard._PUBLIC):
+        row.append(InlineKeyboardButton(label, callback_data=f"export_{format_id}:{srid}"))
+        
+        # Формируем ряды по 2 кнопки
+        if len(row) == 2:
+            buttons.append(row)
+            row = []
+    
+    # Добавляем оставшиеся кнопки
+    if row:
+        buttons.append(row)
+        
+    # Добавляем кнопку возврата в меню
+    buttons.append([
+        InlineKeyboardButton(
+            "🔙 Назад",
+            callback_data="menu"
+        )
+    ])
+    
+    return InlineKeyboardMarkup(buttons)
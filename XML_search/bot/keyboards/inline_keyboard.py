@@ -2,9 +2,20 @@
 Inline клавиатура бота
 """
 
+import functools
 from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 from typing import List, Dict, Any
 
+# Кнопки экспорта: (подпись, префикс callback_data), к префиксу добавляется ":{srid}"
+_EXPORT_PREFIXES = (
+    ('xml_Civil3D', 'export_xml'),
+    ('prj_GMv20', 'export_gmv20'),
+    ('prj_GMv25', 'export_gmv25'),
+)
+
+# Поля описания кнопки, для которых используется быстрый путь создания
+_SIMPLE_BUTTON_KEYS = frozenset({'text', 'callback_data'})
+
 class InlineKeyboard:
     """Inline клавиатура бота"""
     
@@ -27,6 +38,15 @@ class InlineKeyboard:
         for button_row_specs in buttons:  # Iterate over each list of button dicts (each list is a row)
             current_row_buttons: List[InlineKeyboardButton] = []
             for button_spec in button_row_specs:  # Iterate over each button dict in the current row
+                # Обычная кнопка задает только text и callback_data: остальные поля не запрашиваем
+                if button_spec.keys() <= _SIMPLE_BUTTON_KEYS:
+                    current_row_buttons.append(
+                        InlineKeyboardButton(
+                            text=button_spec["text"],
+                            callback_data=button_spec.get("callback_data")
+                        )
+                    )
+                    continue
                 current_row_buttons.append(
                     InlineKeyboardButton(
                         text=button_spec["text"],
@@ -64,66 +84,22 @@ class InlineKeyboard:
         Returns:
             Объект inline клавиатуры
         """
-        buttons = [[
-            {
-                'text': 'xml_Civil3D',
-                'callback_data': f'export_xml:{srid}'
-            },
-            {
-                'text': 'prj_GMv20',
-                'callback_data': f'export_gmv20:{srid}'
-            },
-            {
-                'text': 'prj_GMv25',
-                'callback_data': f'export_gmv25:{srid}'
-            }
-        ]]
-        return self.create_inline_keyboard(buttons)
+        return get_export_keyboard_for_srid(str(srid))
 
-# Новая standalone функция, адаптированная из метода класса
+@functools.lru_cache(maxsize=1024)
 def get_export_keyboard_for_srid(srid_str: str) -> InlineKeyboardMarkup:
     """
     Получение клавиатуры экспорта для указанного SRID.
     
+    Разметка неизменяема и зависит только от SRID, поэтому кэшируется.
+    
     Args:
         srid_str: SRID системы координат в виде строки.
         
     Returns:
         Объект inline клавиатуры.
     """
-    # Внутренне можно создать временный экземпляр InlineKeyboard 
-    # или просто скопировать логику создания кнопок, что проще здесь.
-    
-    # srid = int(srid_str) # Преобразование в int, если необходимо для callback_data, 
-                         # но f-string справится со строкой.
-
-    buttons_data = [[
-        {
-            'text': 'xml_Civil3D',
-            'callback_data': f'export_xml:{srid_str}' # Используем srid_str напрямую
-        },
-        {
-            'text': 'prj_GMv20',
-            'callback_data': f'export_gmv20:{srid_str}'
-        },
-        {
-            'text': 'prj_GMv25',
-            'callback_data': f'export_gmv25:{srid_str}'
-        }
-    ]]
-    
-    # Логика создания InlineKeyboardMarkup из InlineKeyboard.create_inline_keyboard
-    # Здесь мы можем ее упростить, так как структура кнопок фиксирована (одна строка)
-    keyboard_buttons_row = []
-    for button_def in buttons_data[0]: # У нас одна строка кнопок
-        keyboard_buttons_row.append(
-            InlineKeyboardButton(
-                text=button_def["text"],
-                callback_data=button_def.get("callback_data"),
-                url=button_def.get("url"), # на случай если понадобится
-                switch_inline_query=button_def.get("switch_inline_query"),
-                switch_inline_query_current_chat=button_def.get("switch_inline_query_current_chat")
-            )
-        )
-            
-    return InlineKeyboardMarkup([keyboard_buttons_row]) 
\ No newline at end of file
+    return InlineKeyboardMarkup([[
+        InlineKeyboardButton(label, callback_data=f"{prefix}:{srid_str}")
+        for label, prefix in _EXPORT_PREFIXES
+    ]])
@@ -2,9 +2,9 @@
 Клавиатура главного меню
 """
 
-from typing import List
+from typing import List, FrozenSet
 from telegram import ReplyKeyboardMarkup, KeyboardButton
-from .base_keyboard import BaseKeyboard
+from .base import BaseKeyboard
 
 # Кнопки главного меню
 BUTTON_COORD_SEARCH = 'Поиск СК по Lat/Lon'
@@ -30,6 +30,32 @@ class MainKeyboard(BaseKeyboard):
     BUTTON_SEARCH_TEXT = 'Поиск СК по описанию'
     BUTTON_DESC_SEARCH = 'Поиск СК по описанию'
     
+    # Тексты кнопок возврата в меню для filters.Text (проверка вхождения за O(1))
+    BACK_BUTTONS: FrozenSet[str] = frozenset({BUTTON_MENU})
+    
+    # Готовые разметки: кнопки заданы константами, поэтому создаются один раз
+    _MAIN_MARKUP = ReplyKeyboardMarkup(
+        [
+            [KeyboardButton(BUTTON_SEARCH)],
+            [KeyboardButton(BUTTON_EXPORT)],
+            [KeyboardButton(BUTTON_HELP), KeyboardButton(BUTTON_SETTINGS)]
+        ],
+        resize_keyboard=True
+    )
+    _BACK_MARKUP = ReplyKeyboardMarkup([[KeyboardButton(BUTTON_MENU)]], resize_keyboard=True)
+    # Меню выбора типа поиска: эти тексты распознает состояние MAIN_MENU
+    _SEARCH_MENU_MARKUP = ReplyKeyboardMarkup(
+        [
+            [KeyboardButton(BUTTON_SEARCH_COORD)],
+            [KeyboardButton(BUTTON_DESC_SEARCH)]
+        ],
+        resize_keyboard=True
+    )
+    
+    def __init__(self):
+        """Инициализация клавиатуры главного меню"""
+        super().__init__(keyboard_type='main')
+        
     def get_keyboard(self) -> ReplyKeyboardMarkup:
         """
         Получение клавиатуры главного меню
@@ -37,12 +63,7 @@ class MainKeyboard(BaseKeyboard):
         Returns:
             ReplyKeyboardMarkup: Клавиатура с кнопками
         """
-        keyboard = [
-            [KeyboardButton(self.BUTTON_SEARCH)],
-            [KeyboardButton(self.BUTTON_EXPORT)],
-            [KeyboardButton(self.BUTTON_HELP), KeyboardButton(self.BUTTON_SETTINGS)]
-        ]
-        return ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+        return self._MAIN_MARKUP
         
     def get_back_keyboard(self) -> ReplyKeyboardMarkup:
         """
@@ -51,8 +72,17 @@ class MainKeyboard(BaseKeyboard):
         Returns:
             ReplyKeyboardMarkup: Клавиатура с кнопкой возврата
         """
-        keyboard = [[KeyboardButton(self.BUTTON_MENU)]]
-        return ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+        return self._BACK_MARKUP
+        
+    @classmethod
+    def get_cached_keyboard(cls) -> ReplyKeyboardMarkup:
+        """
+        Получение готовой клавиатуры меню выбора типа поиска без создания экземпляра
+        
+        Returns:
+            ReplyKeyboardMarkup: Клавиатура с кнопками поиска
+        """
+        return cls._SEARCH_MENU_MARKUP
         
     @classmethod
     def get_all_buttons(cls) -> List[str]:
@@ -2,9 +2,11 @@
 Клавиатура главного меню
 """
 
+import functools
+from types import MappingProxyType
 from typing import Dict
-from telegram import ReplyKeyboardMarkup, KeyboardButton
 from .base import BaseKeyboard, KeyboardResult
+from .main_keyboard import MainKeyboard
 
 class MainMenuKeyboard(BaseKeyboard):
     """Клавиатура главного меню"""
@@ -21,34 +23,31 @@ class MainMenuKeyboard(BaseKeyboard):
         Построение клавиатуры главного меню
         
         Returns:
-            Результат построения клавиатуры
+            Результат построения клавиатуры (общий экземпляр)
         """
         try:
-            # Создаем кнопки
-            buttons = [
-                [KeyboardButton(self.BUTTONS['coord_search'])],
-                [KeyboardButton(self.BUTTONS['desc_search'])]
-            ]
-            
-            # Валидируем кнопки
-            if not self._validate_buttons(buttons):
-                raise ValueError("Ошибка валидации кнопок")
-            
-            # Создаем клавиатуру
-            keyboard = ReplyKeyboardMarkup(
-                buttons,
-                resize_keyboard=True,
-                one_time_keyboard=False
-            )
+            result = _build_main_menu()
             
             # Отслеживаем создание
             self._track_build('main_menu')
             
-            return KeyboardResult(
-                keyboard=keyboard,
-                metadata={'type': 'main_menu'}
-            )
+            return result
             
         except Exception as e:
             self._track_build('main_menu', success=False)
-            raise ValueError(f"Ошибка создания клавиатуры главного меню: {e}") 
\ No newline at end of file
+            raise ValueError(f"Ошибка создания клавиатуры главного меню: {e}")
+
+
+@functools.cache
+def _build_main_menu() -> KeyboardResult:
+    """
+    Однократное построение клавиатуры главного меню
+
+    Returns:
+        Неизменяемый результат: разметка и метаданные только для чтения
+    """
+    # Разметка общая с MainKeyboard, чтобы меню поиска не расходились
+    return KeyboardResult(
+        keyboard=MainKeyboard.get_cached_keyboard(),
+        metadata=MappingProxyType({'type': 'main_menu'})
+    )
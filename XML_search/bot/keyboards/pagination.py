@@ -2,22 +2,38 @@
 Клавиатура пагинации
 """
 
-from typing import List, Dict, Any, Optional
+import functools
+import sys
+from typing import List, Dict, Any, Optional, NamedTuple
 from telegram import InlineKeyboardMarkup, InlineKeyboardButton
-from XML_search.enhanced.metrics_manager import MetricsManager
-from XML_search.enhanced.log_manager import LogManager
-from XML_search.enhanced.cache_manager import CacheManager
 from .base import BaseKeyboard, KeyboardResult
 
+# Размер кэша разметок пагинации
+_PAGINATION_MARKUP_CACHE_SIZE = 2048
+# Размер кэша навигационных кнопок (подпись, номер страницы)
+_PAGE_BUTTON_CACHE_SIZE = 4096
+
+# Префикс callback_data навигационных кнопок
+_PAGE_CALLBACK_PREFIX = "page:"
+_PAGE_CALLBACK_PREFIX_LEN = len(_PAGE_CALLBACK_PREFIX)
+
+# Статические callback_data информационных кнопок
+_CURRENT_PAGE_CALLBACK = "current_page"
+_TOTAL_ITEMS_CALLBACK = "total_items"
+
+class PaginationMeta(NamedTuple):
+    """Метаданные клавиатуры пагинации"""
+    total_items: int
+    current_page: int
+    total_pages: int
+    items_per_page: int
+
 class PaginationKeyboard(BaseKeyboard):
     """Клавиатура для пагинации результатов"""
     
     def __init__(self):
         """Инициализация клавиатуры пагинации"""
         super().__init__("pagination")
-        self.metrics = MetricsManager()
-        self.logger = LogManager().get_logger(__name__)
-        self.cache = CacheManager()
         
     def build(
         self,
@@ -39,95 +55,19 @@ class PaginationKeyboard(BaseKeyboard):
             Результат построения клавиатуры
         """
         try:
-            # Проверяем кэш
-            cache_key = f"pagination_{total_items}_{current_page}_{items_per_page}"
-            cached_result = self.cache.get(cache_key)
-            if cached_result:
-                self.metrics.increment('keyboard_cache_hits')
-                return cached_result
-            
-            # Вычисляем параметры пагинации
-            total_pages = (total_items + items_per_page - 1) // items_per_page
-            buttons = []
-            
-            # Добавляем навигационные кнопки
-            nav_buttons = []
-            
-            # Кнопка "В начало"
-            if current_page > 2:
-                nav_buttons.append(
-                    InlineKeyboardButton(
-                        "⏮",
-                        callback_data="page:1"
-                    )
-                )
-            
-            # Кнопка "Назад"
-            if current_page > 1:
-                nav_buttons.append(
-                    InlineKeyboardButton(
-                        "⬅️",
-                        callback_data=f"page:{current_page-1}"
-                    )
-                )
-            
-            # Индикатор страницы
-            nav_buttons.append(
-                InlineKeyboardButton(
-                    f"{current_page}/{total_pages}",
-                    callback_data="current_page"
-                )
-            )
+            keyboard = _build_pagination_markup(total_items, current_page, items_per_page)
+            self.metrics.increment('keyboard_builds')
             
-            # Кнопка "Вперед"
-            if current_page < total_pages:
-                nav_buttons.append(
-                    InlineKeyboardButton(
-                        "➡️",
-                        callback_data=f"page:{current_page+1}"
-                    )
-                )
-            
-            # Кнопка "В конец"
-            if current_page < total_pages - 1:
-                nav_buttons.append(
-                    InlineKeyboardButton(
-                        "⏭",
-                        callback_data=f"page:{total_pages}"
-                    )
-                )
-            
-            buttons.append(nav_buttons)
-            
-            # Добавляем информацию о количестве элементов
-            info_buttons = [
-                InlineKeyboardButton(
-                    f"Всего: {total_items}",
-                    callback_data="total_items"
-                )
-            ]
-            buttons.append(info_buttons)
-            
-            # Создаем клавиатуру
-            keyboard = InlineKeyboardMarkup(buttons)
-            
-            # Создаем результат
-            result = KeyboardResult(
+            return KeyboardResult(
                 keyboard=keyboard,
-                metadata={
-                    'total_items': total_items,
-                    'current_page': current_page,
-                    'total_pages': total_pages,
-                    'items_per_page': items_per_page
-                }
+                metadata=PaginationMeta(
+                    total_items,
+                    current_page,
+                    (total_items + items_per_page - 1) // items_per_page,
+                    items_per_page
+                )
             )
             
-            # Кэшируем результат
-            self.cache.set(cache_key, result)
-            self.metrics.increment('keyboard_cache_sets')
-            
-            return result
-            
         except Exception as e:
             self.logger.error(f"Ошибка при создании клавиатуры пагинации: {e}")
             self.metrics.increment('keyboard_errors')
@@ -137,6 +77,26 @@ class PaginationKeyboard(BaseKeyboard):
                 metadata={}
             )
             
+    @staticmethod
+    def _parse_page(callback_data: str) -> Optional[int]:
+        """
+        Разбор номера страницы из callback_data вида "page:N"
+        
+        Args:
+            callback_data: Данные callback
+            
+        Returns:
+            Номер страницы (> 0) или None
+        """
+        if not callback_data.startswith(_PAGE_CALLBACK_PREFIX):
+            return None
+        tail = callback_data[_PAGE_CALLBACK_PREFIX_LEN:]
+        # isascii отсекает юникодные цифры, которые не принимает int()
+        if not (tail.isascii() and tail.isdigit()):
+            return None
+        page = int(tail)
+        return page if page > 0 else None
+            
     def validate_callback_data(self, callback_data: str) -> bool:
         """
         Валидация callback_data
@@ -147,18 +107,7 @@ class PaginationKeyboard(BaseKeyboard):
         Returns:
             True если данные валидны
         """
-        try:
-            if not callback_data.startswith('page:'):
-                return False
-                
-            # Проверяем номер страницы
-            _, page = callback_data.split(':', 1)
-            page = int(page)
-            return page > 0
-            
-        except Exception as e:
-            self.logger.error(f"Ошибка валидации callback_data: {e}")
-            return False
+        return self._parse_page(callback_data) is not None
             
     def get_page_info(self, callback_data: str) -> Optional[Dict[str, Any]]:
         """
@@ -170,15 +119,57 @@ class PaginationKeyboard(BaseKeyboard):
         Returns:
             Словарь с информацией о странице или None
         """
-        try:
-            if not self.validate_callback_data(callback_data):
-                return None
-                
-            _, page = callback_data.split(':', 1)
-            return {
-                'page': int(page)
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Ошибка получения информации о странице: {e}")
-            return None 
\ No newline at end of file
+        page = self._parse_page(callback_data)
+        return {'page': page} if page is not None else None
+
+
+@functools.lru_cache(maxsize=_PAGE_BUTTON_CACHE_SIZE)
+def _page_button(label: str, page: int) -> InlineKeyboardButton:
+    """
+    Навигационная кнопка перехода на страницу (общий экземпляр)
+    
+    Args:
+        label: Подпись кнопки
+        page: Номер страницы
+        
+    Returns:
+        Кнопка с интернированной callback_data
+    """
+    return InlineKeyboardButton(label, callback_data=sys.intern(f"page:{page}"))
+
+
+@functools.lru_cache(maxsize=_PAGINATION_MARKUP_CACHE_SIZE)
+def _build_pagination_markup(total_items: int, current_page: int, items_per_page: int) -> InlineKeyboardMarkup:
+    """
+    Построение разметки пагинации (кэшируется по параметрам страницы)
+    
+    Args:
+        total_items: Общее количество элементов
+        current_page: Текущая страница
+        items_per_page: Элементов на странице
+        
+    Returns:
+        Неизменяемая разметка клавиатуры
+    """
+    # Вычисляем параметры пагинации
+    total_pages = (total_items + items_per_page - 1) // items_per_page
+    total_row = [InlineKeyboardButton(f"Всего: {total_items}", callback_data=_TOTAL_ITEMS_CALLBACK)]
+    
+    # Одна страница: навигация не нужна
+    if total_pages <= 1:
+        return InlineKeyboardMarkup([total_row])
+    
+    # Навигационные кнопки: (условие показа, подпись, номер страницы)
+    nav_specs = (
+        (current_page > 2, "⏮", 1),
+        (current_page > 1, "⬅️", current_page - 1),
+        (current_page < total_pages, "➡️", current_page + 1),
+        (current_page < total_pages - 1, "⏭", total_pages),
+    )
+    nav_buttons = [_page_button(label, page) for shown, label, page in nav_specs[:2] if shown]
+    nav_buttons.append(
+        InlineKeyboardButton(f"{current_page}/{total_pages}", callback_data=_CURRENT_PAGE_CALLBACK)
+    )
+    nav_buttons.extend(_page_button(label, page) for shown, label, page in nav_specs[2:] if shown)
+    
+    return InlineKeyboardMarkup([nav_buttons, total_row])
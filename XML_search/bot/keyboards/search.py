@@ -2,10 +2,21 @@
 Клавиатура поиска и фильтров
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple
 from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 from .base import BaseKeyboard, KeyboardResult
 
+# Статические ряды клавиатуры поиска (общие для всех пользователей)
+_QUICK_SEARCH_ROW = (InlineKeyboardButton("🔍 Быстрый поиск", switch_inline_query_current_chat=""),)
+_RESET_ROW = (InlineKeyboardButton("🔄 Сбросить фильтры", callback_data="reset_filters"),)
+_BACK_ROW = (InlineKeyboardButton("🔙 Назад", callback_data="menu"),)
+
+class SearchMeta(NamedTuple):
+    """Метаданные клавиатуры поиска"""
+    type: str
+    filters: Optional[Dict[str, Any]]
+    active_filters: List[str]
+
 class SearchKeyboard(BaseKeyboard):
     """Клавиатура поиска и фильтров"""
     
@@ -28,6 +39,15 @@ class SearchKeyboard(BaseKeyboard):
         }
     }
     
+    # Готовые кнопки фильтров: (неактивная, активная с отметкой ✓)
+    _FILTER_BUTTONS: Dict[str, Tuple[InlineKeyboardButton, InlineKeyboardButton]] = {
+        filter_id: (
+            InlineKeyboardButton(info['label'], callback_data=info['callback']),
+            InlineKeyboardButton(f"{info['label']} ✓", callback_data=info['callback'])
+        )
+        for filter_id, info in FILTERS.items()
+    }
+    
     def build(self, filters: Optional[Dict[str, Any]] = None) -> KeyboardResult:
         """
         Построение клавиатуры поиска
@@ -39,62 +59,32 @@ class SearchKeyboard(BaseKeyboard):
             Результат построения клавиатуры
         """
         try:
-            buttons = [
-                # Кнопка быстрого поиска
-                [InlineKeyboardButton(
-                    "🔍 Быстрый поиск",
-                    switch_inline_query_current_chat=""
-                )]
+            # Активные фильтры: один проход и для кнопки сброса, и для метаданных
+            active_filters = [
+                filter_id for filter_id, value in (filters or {}).items()
+                if value
             ]
             
-            # Добавляем кнопки фильтров
-            for filter_id, info in self.FILTERS.items():
-                # Проверяем активен ли фильтр
+            buttons = [_QUICK_SEARCH_ROW]
+            
+            # Добавляем кнопки фильтров (готовые пары: неактивная, активная)
+            for filter_id, (inactive, active) in self._FILTER_BUTTONS.items():
                 is_active = filters and filters.get(filter_id)
-                label = f"{info['label']} ✓" if is_active else info['label']
-                
-                buttons.append([
-                    InlineKeyboardButton(
-                        label,
-                        callback_data=f"{info['callback']}"
-                    )
-                ])
+                buttons.append((active if is_active else inactive,))
             
             # Кнопка сброса фильтров если есть активные
-            if filters and any(filters.values()):
-                buttons.append([
-                    InlineKeyboardButton(
-                        "🔄 Сбросить фильтры",
-                        callback_data="reset_filters"
-                    )
-                ])
+            if active_filters:
+                buttons.append(_RESET_ROW)
             
             # Кнопка возврата в меню
-            buttons.append([
-                InlineKeyboardButton(
-                    "🔙 Назад",
-                    callback_data="menu"
-                )
-            ])
-            
-            # Валидируем кнопки
-            for row in buttons:
-                if not self._validate_buttons([row]):
-                    raise ValueError("Ошибка валидации кнопок")
+            buttons.append(_BACK_ROW)
             
             # Отслеживаем метрики
             self._track_build('search')
             
             return KeyboardResult(
                 keyboard=InlineKeyboardMarkup(buttons),
-                metadata={
-                    'type': 'search',
-                    'filters': filters,
-                    'active_filters': [
-                        filter_id for filter_id, value in (filters or {}).items()
-                        if value
-                    ]
-                }
+                metadata=SearchMeta('search', filters, active_filters)
             )
             
         except Exception as e:
@@ -2,37 +2,49 @@
 Состояния для ConversationHandler
 """
 
-from enum import Enum, auto
+from enum import Enum, IntEnum
 
-class States(Enum):
-    """Состояния диалога с ботом"""
+class States(IntEnum):
+    """
+    Состояния диалога с ботом
+    
+    Явные целые значения совпадают с прежними auto() и не должны меняться:
+    состояния хранятся в user_data и служат ключами ConversationHandler.
+    """
     # Базовые состояния
-    START = auto()  # Начальное состояние
-    AUTH = auto()  # Авторизация
-    MAIN_MENU = auto()  # Главное меню
-    ERROR = auto()  # Общая ошибка
-    UNKNOWN = auto()  # Неизвестное состояние
+    START = 1  # Начальное состояние
+    AUTH = 2  # Авторизация
+    MAIN_MENU = 3  # Главное меню
+    ERROR = 4  # Общая ошибка
+    UNKNOWN = 5  # Неизвестное состояние
     
     # Состояния поиска
-    SEARCH_INPUT = auto()  # Ввод поискового запроса
-    SEARCH_RESULTS = auto()  # Результаты поиска
-    SEARCH_ERROR = auto()  # Ошибка поиска
+    SEARCH_INPUT = 6  # Ввод поискового запроса
+    SEARCH_RESULTS = 7  # Результаты поиска
+    SEARCH_ERROR = 8  # Ошибка поиска
     
     # Состояния координат
-    COORD_INPUT = auto()  # Ввод координат
-    COORD_RESULTS = auto()  # Результаты поиска по координатам
-    COORD_ERROR = auto()  # Ошибка обработки координат
+    COORD_INPUT = 9  # Ввод координат
+    COORD_RESULTS = 10  # Результаты поиска по координатам
+    COORD_ERROR = 11  # Ошибка обработки координат
     
     # Состояния экспорта
-    WAITING_EXPORT = auto()  # Ожидание экспорта
-    EXPORT_FORMAT = auto()  # Выбор формата экспорта
-    EXPORT_PARAMS = auto()  # Параметры экспорта
-    EXPORT_COMPLETE = auto()  # Экспорт завершен
-    EXPORT_ERROR = auto()  # Ошибка экспорта
-    EXPORT_VALIDATION_ERROR = auto()  # Ошибка валидации при экспорте
+    WAITING_EXPORT = 12  # Ожидание экспорта
+    EXPORT_FORMAT = 13  # Выбор формата экспорта
+    EXPORT_PARAMS = 14  # Параметры экспорта
+    EXPORT_COMPLETE = 15  # Экспорт завершен
+    EXPORT_ERROR = 16  # Ошибка экспорта
+    EXPORT_VALIDATION_ERROR = 17  # Ошибка валидации при экспорте
+    EXPORT_MENU = 18  # Меню экспорта
+    
+    # В логах показываем имя состояния, а не число
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
 
 class StateData:
     """Данные состояния диалога"""
+    __slots__ = ('previous_state', 'current_state', 'context')
+    
     def __init__(self):
         self.previous_state = None
         self.current_state = States.START
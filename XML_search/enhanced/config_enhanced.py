@@ -35,6 +35,7 @@ class PoolConfig:
     health_check_timeout: int = 5
     max_lifetime: int = 3600
     max_idle_time: int = 300
+    statement_cache_size: int = 256
 
     def __post_init__(self):
         self.retries = int(self.retries)
@@ -43,6 +44,7 @@ class PoolConfig:
         self.health_check_timeout = int(self.health_check_timeout)
         self.max_lifetime = int(self.max_lifetime)
         self.max_idle_time = int(self.max_idle_time)
+        self.statement_cache_size = int(self.statement_cache_size)
         if self.retries < 0:
             raise ConfigValidationError("retries должно быть неотрицательным")
         if self.backoff_factor <= 0:
@@ -55,6 +57,8 @@ class PoolConfig:
             raise ConfigValidationError("max_lifetime должно быть неотрицательным")
         if self.max_idle_time < 0:
             raise ConfigValidationError("max_idle_time должно быть неотрицательным")
+        if self.statement_cache_size < 0:
+            raise ConfigValidationError("statement_cache_size должно быть неотрицательным")
 
 @dataclass
 class SSLConfig:
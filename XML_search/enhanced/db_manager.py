@@ -55,6 +55,9 @@ class DatabaseManager:
                         max_size=self.config.max_connections,
                         command_timeout=self.config.statement_timeout / 1000,  # конвертируем в секунды
                         max_inactive_connection_lifetime=self.config.pool.max_lifetime,
+                        # Кэш подготовленных выражений на соединение: повторные поисковые
+                        # запросы не разбираются и не планируются сервером заново
+                        statement_cache_size=self.config.pool.statement_cache_size,
                         server_settings=server_settings
                     )
                     self._initialized = True
@@ -103,7 +103,10 @@ class DatabasePool:
                 ssl=ssl_config,
                 setup=self._setup_connection,
                 # Дополнительные параметры для надежности в Docker
-                max_inactive_connection_lifetime=self.config.pool.max_lifetime
+                max_inactive_connection_lifetime=self.config.pool.max_lifetime,
+                # Кэш подготовленных выражений на соединение: повторные поисковые
+                # запросы не разбираются и не планируются сервером заново
+                statement_cache_size=self.config.pool.statement_cache_size
             )
             
             self._initialized = True
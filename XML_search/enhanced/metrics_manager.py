@@ -65,6 +65,7 @@ class MetricsManager:
         """Инициализация менеджера метрик"""
         self._metrics: Dict[str, OperationMetrics] = defaultdict(OperationMetrics)
         self._start_times: Dict[str, float] = {}
+        self._counters: Dict[str, int] = defaultdict(int)
         self._lock = asyncio.Lock()
         
     def start_operation(self, operation_name: str) -> float:
@@ -81,6 +82,27 @@ class MetricsManager:
         self._start_times[operation_name] = start_time
         return start_time
         
+    def increment(self, counter_name: str) -> None:
+        """
+        Увеличение счетчика события без замера времени
+        
+        Синхронный вызов: операция атомарна в пределах цикла событий,
+        поэтому блокировка не требуется.
+        
+        Args:
+            counter_name: Имя счетчика
+        """
+        self._counters[counter_name] += 1
+        
+    def get_counters(self) -> Dict[str, int]:
+        """
+        Получение значений счетчиков событий
+        
+        Returns:
+            Dict[str, int]: Значения счетчиков
+        """
+        return dict(self._counters)
+        
     async def record_operation(self, operation_name: str, start_time: float) -> None:
         """
         Запись метрики операции
@@ -120,6 +142,7 @@ class MetricsManager:
         """Сброс всех метрик"""
         self._metrics.clear()
         self._start_times.clear()
+        self._counters.clear()
         
     async def cleanup_old_metrics(self, max_age: timedelta) -> None:
         """
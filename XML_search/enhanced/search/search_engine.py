@@ -3,6 +3,7 @@
 """
 
 from typing import List, Dict, Any, Optional, Union, Tuple
+import asyncio
 import logging
 from XML_search.enhanced.db_manager import DatabaseManager
 from XML_search.enhanced.metrics_manager import MetricsManager
@@ -14,6 +15,14 @@ from XML_search.enhanced.exceptions import DatabaseError
 from .search_utils import SearchUtils
 from XML_search.enhanced.config_enhanced import DatabaseConfig
 import re # Добавлен re для _get_name_and_description
+from collections import OrderedDict
+
+# Число запросов, для которых хранятся готовые варианты транслитерации
+_VARIANTS_CACHE_SIZE = 2048
+
+# Генерация вариантов без lru_cache транслитератора: движок хранит результаты
+# в собственном кэше, и повторное хранение в кэше метода лишь удваивало память
+_generate_prioritized_variants = Transliterator.generate_prioritized_variants.__wrapped__
 
 class EnhancedSearchEngine:
     """Улучшенный класс поискового движка с расширенной функциональностью"""
@@ -64,6 +73,8 @@ class EnhancedSearchEngine:
         self.transliterator = Transliterator()
         # ИСПРАВЛЕНИЕ: Очищаем кэш после изменений в алгоритме замен
         self.transliterator.clear_cache()
+        # Готовые варианты по запросу: попадание не требует перехода в поток
+        self._variants_cache: "OrderedDict[str, List[Tuple[str, int]]]" = OrderedDict()
         self.search_processor = CrsSearchBot(
             db_manager=self.db_manager,
             logger_instance=self.logger,
@@ -72,6 +83,33 @@ class EnhancedSearchEngine:
         )
         self.logger.info("EnhancedSearchEngine инициализирован.")
         
+    async def _get_prioritized_variants(self, query: str) -> List[Tuple[str, int]]:
+        """
+        Приоритезированные варианты транслитерации запроса с кэшированием
+        
+        При попадании в кэш варианты возвращаются сразу; при промахе генерация
+        выполняется в потоке, чтобы не блокировать цикл событий.
+        
+        Args:
+            query: Поисковый запрос
+            
+        Returns:
+            List[Tuple[str, int]]: Пары (вариант, уровень приоритета)
+        """
+        # Регистр не нормализуется: оригинальное написание входит в варианты
+        key = query.strip()
+        cache = self._variants_cache
+        variants = cache.get(key)
+        if variants is not None:
+            cache.move_to_end(key)
+            return variants
+            
+        variants = await asyncio.to_thread(_generate_prioritized_variants, self.transliterator, key)
+        cache[key] = variants
+        if len(cache) > _VARIANTS_CACHE_SIZE:
+            cache.popitem(last=False)
+        return variants
+        
     async def _get_name_and_description(self, srid: int, auth_name_str: str, auth_srid_val: Optional[Any], srtext_from_db: str) -> Tuple[str, str]:
         # ИСПРАВЛЕНИЕ: Проверяем source_table для корректного определения типа записи
         # Получаем дополнительные данные из результата поиска если доступны
@@ -212,8 +250,8 @@ class EnhancedSearchEngine:
         if self.logger: # Логируем только если действительно начинаем текстовый поиск
             self.logger.debug(f"Начало текстового поиска для '{query}', лимит: {limit}")
         
-        # 1. Генерация приоритезированных вариантов для поиска по имени/описанию
-        prioritized_variants = self.transliterator.generate_prioritized_variants(query)
+        # 1. Генерация приоритезированных вариантов для поиска по имени/описанию.
+        prioritized_variants = await self._get_prioritized_variants(query)
         
         # Обрабатываем каждый вариант
         processed_variants_for_cache_key = []
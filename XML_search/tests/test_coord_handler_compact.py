@@ -3,50 +3,67 @@
 """
 
 import unittest
-from unittest.mock import Mock, AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 from XML_search.bot.handlers.coord_handler import CoordHandler, CoordinateInput
 from XML_search.bot.config import BotConfig
 
+# Строки результатов поиска по координатам, общие для тестов
+_UTM_37N = (32637, "UTM zone 37N", "37N", "Universal Transverse Mercator zone 37 N", None, 414668.12, 6176909.34)
+_SK95_Z7 = (100326, "SK95z7", "7", "СК-95 зона 7", None, 414668.12, 6176909.34)
+_SK63_Z7 = (100327, "SK63z7", "7", "СК-63 зона 7", None, 414668.12, 6176909.34)
+
+# Фрагменты, которые должны присутствовать в компактном списке
+_COMPACT_LIST_MARKERS = (
+    "Найдено 3 систем координат",
+    "Lat: 55.7558",
+    "Lon: 37.6173",
+    "1. UTM zone 37N",
+    "2. SK95z7",
+    "3. SK63z7",
+)
+
+# Фрагменты развернутой записи выбранной системы
+_DETAILED_VIEW_MARKERS = (
+    "🔷 1. UTM zone 37N",
+    "SRID: 32637",
+    "Зона: 37N",
+    "Координаты: X=414668.12, Y=6176909.34",
+)
+
 class TestCoordHandlerCompact(unittest.TestCase):
     """Тесты для компактного списка координат"""
     
-    def setUp(self):
-        """Настройка тестового окружения"""
-        # Создаем мок-конфигурацию
-        self.config = Mock(spec=BotConfig)
+    @classmethod
+    def setUpClass(cls):
+        """Настройка тестового окружения (один раз на класс)"""
+        # Обработчик и его моки строятся один раз: тесты вызывают только
+        # чистые методы форматирования и разбора и состояние не меняют
+        cls.config = Mock(spec=BotConfig)
         
-        # Создаем мок для db_manager
-        self.db_manager = Mock()
-        self.db_manager.connection = AsyncMock()
+        # db_manager только сохраняется в обработчике и валидаторах:
+        # тесты не выполняют запросов к БД
+        cls.db_manager = SimpleNamespace()
         
         # Создаем обработчик
-        self.coord_handler = CoordHandler(
-            config=self.config,
-            db_manager=self.db_manager,
-            metrics=Mock(),
-            logger=Mock(),
-            cache=Mock()
+        cls.coord_handler = CoordHandler(
+            config=cls.config,
+            db_manager=cls.db_manager,
+            # Методы под тестом не обращаются к метрикам, логгеру и кэшу
+            metrics=SimpleNamespace(),
+            logger=SimpleNamespace(),
+            cache=SimpleNamespace()
         )
     
     def test_parse_coordinates_decimal(self):
         """Тест парсинга координат в десятичном формате"""
-        # Тест с разделителем $
-        coords = self.coord_handler._parse_coordinates("55.7558$37.6173")
-        self.assertIsNotNone(coords)
-        self.assertEqual(coords.latitude, 55.7558)
-        self.assertEqual(coords.longitude, 37.6173)
-        
-        # Тест с разделителем ;
-        coords = self.coord_handler._parse_coordinates("55.7558;37.6173")
-        self.assertIsNotNone(coords)
-        self.assertEqual(coords.latitude, 55.7558)
-        self.assertEqual(coords.longitude, 37.6173)
-        
-        # Тест с пробелом
-        coords = self.coord_handler._parse_coordinates("55.7558 37.6173")
-        self.assertIsNotNone(coords)
-        self.assertEqual(coords.latitude, 55.7558)
-        self.assertEqual(coords.longitude, 37.6173)
+        # Разделители $, ; и пробел
+        for text in ("55.7558$37.6173", "55.7558;37.6173", "55.7558 37.6173"):
+            with self.subTest(text=text):
+                coords = self.coord_handler._parse_coordinates(text)
+                self.assertIsNotNone(coords)
+                self.assertEqual(coords.latitude, 55.7558)
+                self.assertEqual(coords.longitude, 37.6173)
     
     def test_parse_coordinates_dms(self):
         """Тест парсинга координат в формате градусы-минуты-секунды"""
@@ -62,53 +79,33 @@ class TestCoordHandlerCompact(unittest.TestCase):
     
     def test_parse_coordinates_invalid(self):
         """Тест парсинга некорректных координат"""
-        # Пустая строка
-        coords = self.coord_handler._parse_coordinates("")
-        self.assertIsNone(coords)
-        
-        # Некорректный формат
-        coords = self.coord_handler._parse_coordinates("invalid coordinates")
-        self.assertIsNone(coords)
-        
-        # Только одна координата
-        coords = self.coord_handler._parse_coordinates("55.7558")
-        self.assertIsNone(coords)
+        # Пустая строка, некорректный формат, только одна координата
+        for text in ("", "invalid coordinates", "55.7558"):
+            with self.subTest(text=text):
+                self.assertIsNone(self.coord_handler._parse_coordinates(text))
     
     def test_create_compact_list(self):
         """Тест создания компактного списка"""
         coords = CoordinateInput(latitude=55.7558, longitude=37.6173)
-        results = [
-            (32637, "UTM zone 37N", "37N", "Universal Transverse Mercator zone 37 N", None, 414668.12, 6176909.34),
-            (100326, "SK95z7", "7", "СК-95 зона 7", None, 414668.12, 6176909.34),
-            (100327, "SK63z7", "7", "СК-63 зона 7", None, 414668.12, 6176909.34)
-        ]
+        results = [_UTM_37N, _SK95_Z7, _SK63_Z7]
         
         text = self.coord_handler._create_compact_list(coords, results)
         
         # Проверяем содержимое
-        self.assertIn("Найдено 3 систем координат", text)
-        self.assertIn("Lat: 55.7558", text)
-        self.assertIn("Lon: 37.6173", text)
-        self.assertIn("1. UTM zone 37N", text)
-        self.assertIn("2. SK95z7", text)
-        self.assertIn("3. SK63z7", text)
+        for marker in _COMPACT_LIST_MARKERS:
+            self.assertIn(marker, text)
     
     def test_create_detailed_view(self):
         """Тест создания развернутого вида"""
         coords = CoordinateInput(latitude=55.7558, longitude=37.6173)
-        results = [
-            (32637, "UTM zone 37N", "37N", "Universal Transverse Mercator zone 37 N", None, 414668.12, 6176909.34),
-            (100326, "SK95z7", "7", "СК-95 зона 7", None, 414668.12, 6176909.34)
-        ]
+        results = [_UTM_37N, _SK95_Z7]
         selected_srid = 32637
         
         text = self.coord_handler._create_detailed_view(coords, results, selected_srid)
         
         # Проверяем, что выбранная система развернута
-        self.assertIn("🔷 1. UTM zone 37N", text)
-        self.assertIn("SRID: 32637", text)
-        self.assertIn("Зона: 37N", text)
-        self.assertIn("Координаты: X=414668.12, Y=6176909.34", text)
+        for marker in _DETAILED_VIEW_MARKERS:
+            self.assertIn(marker, text)
         
         # Проверяем, что другая система свернута
         self.assertIn("2. SK95z7", text)
@@ -116,10 +113,7 @@ class TestCoordHandlerCompact(unittest.TestCase):
     
     def test_get_compact_keyboard(self):
         """Тест создания компактной клавиатуры"""
-        results = [
-            (32637, "UTM zone 37N", "37N", "Universal Transverse Mercator zone 37 N", None, 414668.12, 6176909.34),
-            (100326, "SK95z7", "7", "СК-95 зона 7", None, 414668.12, 6176909.34)
-        ]
+        results = [_UTM_37N, _SK95_Z7]
         
         keyboard = self.coord_handler._get_compact_keyboard(results)
         
@@ -133,10 +127,7 @@ class TestCoordHandlerCompact(unittest.TestCase):
     
     def test_get_detailed_keyboard(self):
         """Тест создания развернутой клавиатуры"""
-        results = [
-            (32637, "UTM zone 37N", "37N", "Universal Transverse Mercator zone 37 N", None, 414668.12, 6176909.34),
-            (100326, "SK95z7", "7", "СК-95 зона 7", None, 414668.12, 6176909.34)
-        ]
+        results = [_UTM_37N, _SK95_Z7]
         selected_srid = 32637
         
         keyboard = self.coord_handler._get_detailed_keyboard(selected_srid, results)
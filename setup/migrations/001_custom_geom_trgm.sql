@@ -0,0 +1,23 @@
+-- Индексы для поиска по custom_geom.
+-- Триграммные GIN-индексы обслуживают ILIKE '%...%' по name/info/p, индекс по
+-- выражению CAST(srid AS TEXT) - сравнение SRID с текстом запроса. Условия
+-- поиска объединены через OR, и BitmapOr возможен только если индекс есть
+-- у каждой ветви: без индекса по SRID планировщик выбирает Seq Scan.
+-- Проверка: EXPLAIN (ANALYZE, BUFFERS) поискового запроса на заполненной базе
+-- должен показывать BitmapOr из Bitmap Index Scan по всем четырем индексам
+-- вместо Seq Scan on custom_geom.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS custom_geom_name_trgm
+    ON public.custom_geom USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS custom_geom_info_trgm
+    ON public.custom_geom USING gin (info gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS custom_geom_p_trgm
+    ON public.custom_geom USING gin (p gin_trgm_ops);
+
+-- Выражение должно совпадать с условием запроса: CAST(cg.srid AS TEXT) = $1
+CREATE INDEX IF NOT EXISTS custom_geom_srid_text
+    ON public.custom_geom ((CAST(srid AS TEXT)));